@@ -1,17 +1,41 @@
-from pathlib import Path
-import subprocess
-import sys
-
-ROOT = Path(__file__).resolve().parents[2]
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+import importlib
+import threading
+import traceback
 
+# Each step module exposes main(); they are imported lazily so the
+# heavy scraper dependencies only load when discovery actually runs.
 DISCOVERY_STEPS = [
-    ("External Rankings", "tools/scrapers/external_scraper.py"),
-    ("Data Processor", "tools/scrapers/data_processor.py"),
-    ("Auto Add to Sheet", "tools/scrapers/sheets/auto_adder.py"),
-    ("Discord Notification", "utils/arena/send_intake_dm.py"),
-    ("Smart Enrichment", "tools/scrapers/smart_enrichment.py"), 
+    ("External Rankings", "tools.scrapers.external_scraper"),
+    ("Data Processor", "tools.scrapers.data_processor"),
+    ("Auto Add to Sheet", "tools.scrapers.sheets.auto_adder"),
+    ("Discord Notification", "utils.arena.send_intake_dm"),
+    ("Smart Enrichment", "tools.scrapers.smart_enrichment"),
 ]
 
+# Step -> steps that must finish first. Anything without an edge here
+# starts as soon as the pool has a free worker.
+STEP_PREREQS = {
+    "External Rankings": set(),
+    "Data Processor": {"External Rankings"},
+    "Auto Add to Sheet": {"Data Processor"},
+    "Smart Enrichment": {"Data Processor"},
+    "Discord Notification": {"Auto Add to Sheet"},
+}
+
+
+def _run_step(module_name: str) -> str | None:
+    """Run a step's main() in-process. Returns the traceback on failure."""
+    try:
+        importlib.import_module(module_name).main()
+    except SystemExit as e:
+        # Steps written as scripts may sys.exit(); only a failing code counts
+        if e.code not in (0, None):
+            return traceback.format_exc()
+    except Exception:
+        return traceback.format_exc()
+    return None
+
 
 def run_arena_discovery() -> list[str]:
     """
@@ -20,30 +44,47 @@ def run_arena_discovery() -> list[str]:
     This discovers new candidates, enriches metadata,
     and optionally inserts results into the rankings sheet.
 
+    Independent steps run concurrently; STEP_PREREQS keeps
+    the ordering each step depends on.
+
     Safe to call from:
     - scheduler
     - /admin run_discovery
     """
     logs = ["🔎 **Arena Discovery Started**"]
+    logs_lock = threading.Lock()
+
+    def log(line: str):
+        with logs_lock:
+            logs.append(line)
+
+    modules = dict(DISCOVERY_STEPS)
+    pending = [label for label, _ in DISCOVERY_STEPS]
+    done: set[str] = set()
+    running = {}
+
+    with ThreadPoolExecutor(max_workers=len(DISCOVERY_STEPS)) as pool:
+        while pending or running:
+            for label in [l for l in pending if STEP_PREREQS.get(l, set()) <= done]:
+                pending.remove(label)
+                log(f"🚀 Running **{label}**")
+                running[pool.submit(_run_step, modules[label])] = label
 
-    for label, script in DISCOVERY_STEPS:
-        logs.append(f"🚀 Running **{label}**")
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
 
-        result = subprocess.run(
-            [sys.executable, script],
-            cwd=ROOT,
-            capture_output=True,
-            text=True,
-            encoding='utf-8',  # Force UTF-8 for emoji support on Windows
-            errors='replace',  # Replace invalid chars instead of crashing
-        )
+            for future in finished:
+                label = running.pop(future)
+                error = future.result()
 
-        if result.returncode != 0:
-            logs.append(f"❌ **{label} failed**")
-            logs.append(f"```{result.stderr}```")
-            raise RuntimeError("\n".join(logs))
+                if error:
+                    for other in running:
+                        other.cancel()
+                    log(f"❌ **{label} failed**")
+                    log(f"```{error}```")
+                    raise RuntimeError("\n".join(logs))
 
-        logs.append(f"✅ **{label} completed**")
+                done.add(label)
+                log(f"✅ **{label} completed**")
 
     logs.append("🎉 **Arena Discovery Finished Successfully**")
     return logs
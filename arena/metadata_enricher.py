@@ -9,15 +9,20 @@ Purpose:
 
 from __future__ import annotations
 
-import json
+from datetime import datetime
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
 from typing import Dict, Any
 
-from utils.sheets.google_sheets import GoogleSheetsClient
+import orjson
+
+from tools.scrapers.sheets.sheet_client import SheetClient
 import arena_config
 
 
 METADATA_FILE = Path(arena_config.DATA_DIR) / "metadata_enriched.json"
+STATE_FILE = Path(arena_config.DATA_DIR) / "enricher.state.json"
 
 
 SAFE_FIELDS = [
@@ -30,9 +35,21 @@ SAFE_FIELDS = [
 ]
 
 
+def _tag_set(tags) -> frozenset:
+    """Strip and dedup tags once so merges compare clean tokens."""
+    return frozenset(t for t in (str(raw).strip() for raw in tags if raw) if t)
+
+
+@lru_cache(maxsize=4)
+def _load_cached(path_str: str, mtime_ns: int) -> Dict[str, Dict[str, Any]]:
+    # mtime_ns is part of the cache key only; a rewrite of the file misses
+    data = orjson.loads(Path(path_str).read_bytes())
+    return {e["name"]: e for e in data.get("entries", [])}
+
+
 class MetadataEnricher:
     def __init__(self):
-        self.sheets = GoogleSheetsClient()
+        self.sheets = SheetClient()
         self.sheet_cfg = arena_config.METADATA_SHEET
 
     # ------------------------------------------------------------
@@ -40,6 +57,11 @@ class MetadataEnricher:
     # ------------------------------------------------------------
 
     def run(self) -> int:
+        # Nothing new scraped since the last successful run -> skip the sheet read
+        json_mtime = METADATA_FILE.stat().st_mtime
+        if json_mtime <= self._load_state().get("last_json_mtime", 0):
+            return 0
+
         scraped = self._load_scraped_metadata()
         rows = self.sheets.read_rows(
             spreadsheet_id=self.sheet_cfg["spreadsheet_id"],
@@ -50,56 +72,88 @@ class MetadataEnricher:
             return 0
 
         header = rows[0]
-        updated = 0
+        updates = []
 
         name_idx = header.index("name")
         col_map = {col: i for i, col in enumerate(header)}
 
-        for i, row in enumerate(rows[1:], start=2):
+        # Column positions and per-name source values are fixed for the run,
+        # so resolve them once instead of per row.
+        safe_idx = [(col_map[f], f) for f in SAFE_FIELDS if f in col_map]
+        tags_idx = col_map.get("tags")
+        prepped = {
+            name: {
+                "fields": {f: e.get(f) for f in SAFE_FIELDS},
+                "tags": _tag_set(e.get("tags") or ()),
+            }
+            for name, e in scraped.items()
+        }
+
+        max_cols = len(header)
+
+        for i, row in enumerate(islice(rows, 1, None), start=2):
+            # Cheap membership checks first; most rows have no scraped match
+            if name_idx >= len(row):
+                continue
             name = row[name_idx]
-            if not name or name not in scraped:
+            src = prepped.get(name)
+            if not name or src is None:
                 continue
 
+            # Sheets trims trailing empty cells, so pad to the header width
             updated_row = list(row)
+            if len(updated_row) < max_cols:
+                updated_row.extend([""] * (max_cols - len(updated_row)))
             changed = False
-            src = scraped[name]
+            fields = src["fields"]
 
-            for field in SAFE_FIELDS:
-                idx = col_map.get(field)
-                if idx is None:
-                    continue
-
-                if not updated_row[idx] and src.get(field):
-                    updated_row[idx] = src[field]
+            for idx, field in safe_idx:
+                if not updated_row[idx] and fields[field]:
+                    updated_row[idx] = fields[field]
                     changed = True
 
             # tags (merge)
-            if "tags" in col_map and src.get("tags"):
-                idx = col_map["tags"]
-                existing = set(str(updated_row[idx]).split(",")) if updated_row[idx] else set()
-                merged = existing | set(src["tags"])
-                updated_row[idx] = ", ".join(sorted(t.strip() for t in merged if t.strip()))
-                if merged != existing:
+            if tags_idx is not None and src["tags"]:
+                cell = updated_row[tags_idx]
+                existing = _tag_set(str(cell).split(",")) if cell else frozenset()
+                # Only sort + join when the merge actually adds something
+                if not src["tags"] <= existing:
+                    updated_row[tags_idx] = ", ".join(sorted(existing | src["tags"]))
                     changed = True
 
             if changed:
-                self.sheets.update_row(
-                    spreadsheet_id=self.sheet_cfg["spreadsheet_id"],
-                    sheet_name=self.sheet_cfg["sheet_name"],
-                    row_number=i,
-                    values=updated_row,
-                )
-                updated += 1
+                updates.append((i, updated_row))
 
-        return updated
+        # One batchUpdate instead of a request per row (Sheets write quota)
+        self.sheets.batch_update_rows(
+            spreadsheet_id=self.sheet_cfg["spreadsheet_id"],
+            sheet_name=self.sheet_cfg["sheet_name"],
+            updates=updates,
+        )
+
+        self._save_state(json_mtime)
+        return len(updates)
 
     # ------------------------------------------------------------
     # INTERNALS
     # ------------------------------------------------------------
 
+    def _load_state(self) -> Dict[str, Any]:
+        if not STATE_FILE.exists():
+            return {}
+        try:
+            return orjson.loads(STATE_FILE.read_bytes())
+        except orjson.JSONDecodeError:
+            return {}
+
+    def _save_state(self, json_mtime: float) -> None:
+        STATE_FILE.write_bytes(orjson.dumps({
+            "last_json_mtime": json_mtime,
+            "last_run": datetime.utcnow().isoformat(),
+        }))
+
     def _load_scraped_metadata(self) -> Dict[str, Dict[str, Any]]:
-        data = json.loads(METADATA_FILE.read_text(encoding="utf-8"))
-        return {e["name"]: e for e in data.get("entries", [])}
+        return _load_cached(str(METADATA_FILE), METADATA_FILE.stat().st_mtime_ns)
 
 
 if __name__ == "__main__":
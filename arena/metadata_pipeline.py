@@ -3,10 +3,19 @@
 from __future__ import annotations
 
 import asyncio
-import json
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict
+from typing import Any, List, Dict, Tuple
+
+import aiohttp
+import orjson
+
+try:
+    from aiohttp_client_cache import CachedSession, SQLiteBackend
+except ImportError:  # pragma: no cover
+    CachedSession = None
 
 import arena_config
 
@@ -34,11 +43,42 @@ from utils.sheets.google_sheets import GoogleSheetsClient
 
 OUTPUT_FILE = Path(arena_config.DATA_DIR) / "metadata_enriched.json"
 
+# Names scraped concurrently; each name fans out to every source at once
+NAME_CONCURRENCY = 8
+
+
+def _map_and_normalize(
+    pairs: List[Tuple[Any, Dict]],
+    merge_engine: MergeEngine,
+    name: str,
+) -> Dict | None:
+    """
+    CPU side of a name: map each raw result, merge, normalize.
+    Module-level so it can run in the process pool.
+    """
+    mapped = []
+
+    for mapper, raw in pairs:
+        normalized = mapper.map(raw)
+        if normalized:
+            mapped.append(normalized)
+
+    if not mapped:
+        return None
+
+    merged = merge_engine.merge(mapped)
+    merged["name"] = name
+    merged["slug"] = slugify(name)
+
+    return Normalizer.normalize_metadata(merged)
+
 
 class MetadataPipeline:
     def __init__(self):
         self.sheets = GoogleSheetsClient()
         self.merge_engine = MergeEngine()
+        self.session: aiohttp.ClientSession | None = None
+        self._cpu_pool: ProcessPoolExecutor | None = None
 
         self.scrapers = [
             (BabepediaScraper(), BabepediaMapper()),
@@ -49,29 +89,78 @@ class MetadataPipeline:
             # TMDB goes here later as a normal source
         ]
 
+    async def __aenter__(self) -> "MetadataPipeline":
+        # One keep-alive pool for every scraper; per-host cap keeps us polite
+        connector = aiohttp.TCPConnector(
+            limit=100,
+            limit_per_host=4,
+            ttl_dns_cache=300,
+        )
+
+        if CachedSession is not None:
+            # GET responses are cached on disk so weekly reruns skip the network
+            self.session = CachedSession(
+                cache=SQLiteBackend(
+                    cache_name=str(arena_config.SCRAPER_CACHE_FILE),
+                    expire_after=arena_config.SCRAPER_CACHE_TTL,
+                    allowed_methods=("GET",),
+                    cache_control=True,
+                    ignored_params=["api_key"],
+                ),
+                connector=connector,
+            )
+        else:
+            self.session = aiohttp.ClientSession(connector=connector)
+        for scraper, _ in self.scrapers:
+            scraper.session = self.session
+
+        self._cpu_pool = ProcessPoolExecutor(max_workers=os.cpu_count())
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        if self._cpu_pool is not None:
+            self._cpu_pool.shutdown(wait=False, cancel_futures=True)
+            self._cpu_pool = None
+
+        if self.session is None:
+            return
+        for scraper, _ in self.scrapers:
+            scraper.session = None
+        await self.session.close()
+        self.session = None
+
     # --------------------------------------------------
     # PUBLIC
     # --------------------------------------------------
 
     async def run(self, names: List[str] | None = None) -> int:
+        if self.session is None:
+            async with self:
+                return await self.run(names)
+
         if not names:
             names = self._collect_names()
 
-        results = []
+        sem = asyncio.Semaphore(NAME_CONCURRENCY)
 
-        for name in sorted(set(names)):
-            merged = await self._process_name(name)
-            if merged:
-                results.append(merged)
+        async def limited(name: str) -> Dict | None:
+            async with sem:
+                return await self._process_name(name)
+
+        # dict.fromkeys dedups in O(N) and keeps first-seen order
+        processed = await asyncio.gather(*(limited(n) for n in dict.fromkeys(names)))
+        results = [merged for merged in processed if merged]
 
         payload = {
             "generated_at": datetime.utcnow().isoformat(),
             "entries": results,
         }
 
-        OUTPUT_FILE.write_text(
-            json.dumps(payload, indent=2, ensure_ascii=False),
-            encoding="utf-8",
+        OUTPUT_FILE.write_bytes(
+            orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
         )
 
         MetadataEnricher().run()
@@ -89,23 +178,23 @@ class MetadataPipeline:
         )
         return [r for r in rows if r]
 
-    async def _process_name(self, name: str) -> Dict:
-        mapped = []
-
-        for scraper, mapper in self.scrapers:
-            raw = await scraper.fetch(name)
-            if not raw:
-                continue
-
-            normalized = mapper.map(raw)
-            if normalized:
-                mapped.append(normalized)
+    async def _process_name(self, name: str) -> Dict | None:
+        raws = await asyncio.gather(
+            *(scraper.fetch(name) for scraper, _ in self.scrapers),
+            return_exceptions=True,
+        )
 
-        if not mapped:
-            return {}
+        pairs = [
+            (mapper, raw)
+            for (_, mapper), raw in zip(self.scrapers, raws)
+            if raw and not isinstance(raw, BaseException)
+        ]
 
-        merged = self.merge_engine.merge(mapped)
-        merged["name"] = name
-        merged["slug"] = slugify(name)
+        if not pairs:
+            return None
 
-        return Normalizer.normalize_metadata(merged)
+        # Mapping/merging is pure CPU; keep it off the event loop
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._cpu_pool, _map_and_normalize, pairs, self.merge_engine, name
+        )
@@ -0,0 +1,133 @@
+"""
+JARVIS Arena — Scraper rate limiting
+
+Per-host AIMD concurrency limiter plus a retry decorator for scraper
+fetch() methods:
+- 429 halves the host's concurrency, every 30 clean requests adds one back
+- 429/502/503/504 are retried with exponential backoff (or Retry-After)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import functools
+import random
+import weakref
+from typing import Dict, Optional
+
+import arena_config
+
+
+RETRY_STATUSES = frozenset({429, 502, 503, 504})
+SUCCESSES_PER_STEP = 30
+MAX_BACKOFF = 60
+
+
+class RetryableHTTPError(Exception):
+    def __init__(self, status: int, retry_after: Optional[float] = None):
+        super().__init__(f"HTTP {status}")
+        self.status = status
+        self.retry_after = retry_after
+
+
+def raise_for_retry(response) -> None:
+    """Raise RetryableHTTPError if an aiohttp response should be retried."""
+    if response.status not in RETRY_STATUSES:
+        return
+
+    retry_after = None
+    header = response.headers.get("Retry-After")
+    if header:
+        try:
+            retry_after = float(header)
+        except ValueError:
+            pass
+
+    raise RetryableHTTPError(response.status, retry_after)
+
+
+class HostLimiter:
+    def __init__(self, max_concurrency: int):
+        self.max_concurrency = max_concurrency
+        self.limit = max_concurrency
+        self._active = 0
+        self._successes = 0
+        self._cond = asyncio.Condition()
+
+    @contextlib.asynccontextmanager
+    async def slot(self):
+        async with self._cond:
+            await self._cond.wait_for(lambda: self._active < self.limit)
+            self._active += 1
+
+        # True: clean return, False: 429. Any other failure (5xx, network
+        # errors) stays None and counts as neither.
+        ok: Optional[bool] = None
+        try:
+            yield
+            ok = True
+        except RetryableHTTPError as e:
+            if e.status == 429:
+                ok = False
+            raise
+        finally:
+            async with self._cond:
+                self._active -= 1
+                if ok is not None:
+                    self._record(throttled=not ok)
+                self._cond.notify_all()
+
+    def _record(self, throttled: bool) -> None:
+        if throttled:
+            self.limit = max(1, self.limit // 2)
+            self._successes = 0
+            return
+
+        self._successes += 1
+        if self._successes >= SUCCESSES_PER_STEP:
+            self.limit = min(self.max_concurrency, self.limit + 1)
+            self._successes = 0
+
+
+# asyncio primitives bind to one loop, so limiters are kept per loop
+_limiters: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, HostLimiter]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_limiter(host: str) -> HostLimiter:
+    per_loop = _limiters.setdefault(asyncio.get_running_loop(), {})
+    if host not in per_loop:
+        cap = arena_config.SCRAPER_HOST_LIMITS.get(host, arena_config.SCRAPER_DEFAULT_HOST_LIMIT)
+        per_loop[host] = HostLimiter(cap)
+    return per_loop[host]
+
+
+def rate_limited(host: str):
+    """
+    Decorate an async scraper fetch(). The wrapped call runs inside the
+    host's limiter and is retried up to arena_config.MAX_RETRIES times
+    when it raises RetryableHTTPError.
+    """
+
+    def decorator(fetch):
+        @functools.wraps(fetch)
+        async def wrapper(*args, **kwargs):
+            limiter = get_limiter(host)
+
+            for attempt in range(arena_config.MAX_RETRIES + 1):
+                try:
+                    async with limiter.slot():
+                        return await fetch(*args, **kwargs)
+                except RetryableHTTPError as e:
+                    if attempt >= arena_config.MAX_RETRIES:
+                        raise
+                    wait = e.retry_after
+                    if wait is None:
+                        wait = min(MAX_BACKOFF, 2 ** attempt + random.random())
+                    await asyncio.sleep(wait)
+
+        return wrapper
+
+    return decorator
@@ -6,111 +6,176 @@ This is called as the final step in discovery_runner.
 """
 
 import sys
-import io
 from pathlib import Path
 
-# Force UTF-8 encoding
-sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
-sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
-
 # Add project root to path
 PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
-import json
-import requests
+import asyncio
+import itertools
+import aiohttp
+import ijson
+import orjson
 import arena_config
 from config import DISCORD_OWNER_ID, TOKEN
 
-# Load discovery notifications
-notif_file = Path(arena_config.DATA_DIR) / "discovery_notifications.json"
+DISPLAY_LIMIT = 10
+MAX_ATTEMPTS = 5
+
+
+def _load_notifications(notif_file: Path) -> tuple[int, list[dict]]:
+    """
+    Stream the notifications file: read the total plus only the entries
+    that will be shown, never the whole list.
+    """
+    with open(notif_file, 'rb') as f:
+        # discovery_notifier writes "count" ahead of the list
+        total = next(ijson.items(f, "count"), None)
+
+        f.seek(0)
+        top = list(itertools.islice(
+            ijson.items(f, "notifications.item", use_float=True), DISPLAY_LIMIT
+        ))
+
+        if total is None:
+            f.seek(0)
+            total = sum(1 for _ in ijson.items(f, "notifications.item"))
+
+    return int(total), top
 
-if not notif_file.exists():
-    print("ℹ️  No new candidates to notify about")
-    sys.exit(0)
 
-with open(notif_file, 'r', encoding='utf-8') as f:
-    data = json.load(f)
+async def _post(session: aiohttp.ClientSession, url: str, payload: dict) -> tuple[int, bytes]:
+    """
+    POST to Discord honoring its rate-limit headers: sleep out a 429's
+    Retry-After, and wait for the bucket reset when it reports 0 remaining.
+    """
+    data = orjson.dumps(payload)
 
-candidates = data.get('notifications', [])
+    for _ in range(MAX_ATTEMPTS):
+        async with session.post(url, data=data) as resp:
+            body = await resp.read()
 
-if not candidates:
-    print("ℹ️  No new candidates found")
-    sys.exit(0)
+            if resp.status == 429:
+                retry_after = resp.headers.get("Retry-After")
+                if retry_after is None:
+                    try:
+                        retry_after = orjson.loads(body).get("retry_after", 1)
+                    except orjson.JSONDecodeError:
+                        retry_after = 1
+                await asyncio.sleep(float(retry_after))
+                continue
 
-print(f"📬 Sending DM about {len(candidates)} new candidates...")
+            if resp.headers.get("X-RateLimit-Remaining") == "0":
+                await asyncio.sleep(float(resp.headers.get("X-RateLimit-Reset-After", 0)))
+
+            return resp.status, body
+
+    raise RuntimeError(f"Rate limited by Discord after {MAX_ATTEMPTS} attempts: {url}")
+
+
+async def _send_dm(embed: dict) -> None:
+    headers = {
+        "Authorization": f"Bot {TOKEN}",
+        "Content-Type": "application/json"
+    }
 
-# Build embed using Discord webhook/DM API
-embed = {
-    "title": "🔍 New Arena Candidates Discovered",
-    "description": f"Found **{len(candidates)}** new candidates for your rankings!",
-    "color": 15844367,  # Gold
-    "fields": [],
-    "footer": {
-        "text": "Check ARENA_INTAKE sheet to review and approve"
+    # One session so both calls reuse the same TLS connection.
+    # Bodies are pre-serialized with orjson; the session sets Content-Type.
+    async with aiohttp.ClientSession(
+        headers=headers,
+        timeout=aiohttp.ClientTimeout(total=15),
+    ) as session:
+        # Step 1: Create DM channel with owner
+        status, body = await _post(
+            session,
+            "https://discord.com/api/v10/users/@me/channels",
+            {"recipient_id": str(DISCORD_OWNER_ID)},
+        )
+        if status != 200:
+            raise RuntimeError(
+                f"Failed to create DM channel: {status}\n{body.decode(errors='replace')}"
+            )
+        dm_channel_id = orjson.loads(body)["id"]
+
+        # Step 2: Send message to DM channel
+        status, body = await _post(
+            session,
+            f"https://discord.com/api/v10/channels/{dm_channel_id}/messages",
+            {"embeds": [embed]},
+        )
+        if status != 200:
+            raise RuntimeError(
+                f"Failed to send DM: {status}\n{body.decode(errors='replace')}"
+            )
+
+
+def main() -> None:
+    # Load discovery notifications
+    notif_file = Path(arena_config.DATA_DIR) / "discovery_notifications.json"
+
+    if not notif_file.exists():
+        print("ℹ️  No new candidates to notify about")
+        return
+
+    total, candidates = _load_notifications(notif_file)
+
+    if not candidates:
+        print("ℹ️  No new candidates found")
+        return
+
+    print(f"📬 Sending DM about {total} new candidates...")
+
+    # Build embed using Discord webhook/DM API
+    embed = {
+        "title": "🔍 New Arena Candidates Discovered",
+        "description": f"Found **{total}** new candidates for your rankings!",
+        "color": 15844367,  # Gold
+        "fields": [],
+        "footer": {
+            "text": "Check ARENA_INTAKE sheet to review and approve"
+        }
     }
-}
-
-# Add top candidates (limit to 10)
-display_count = min(len(candidates), 10)
-
-for i, candidate in enumerate(candidates[:display_count], 1):
-    name = candidate.get('name', 'Unknown')
-    score = candidate.get('discovery_score', 0)
-    sources = candidate.get('source_count', 0)
-    archetype = candidate.get('archetype', 'Unknown')
-    
-    field_value = f"**Score:** {score}/100\n**Sources:** {sources}/4\n**Type:** {archetype}"
-    
-    reasons = candidate.get('reasons', [])
-    if reasons:
-        field_value += f"\n• {reasons[0]}"
-    
-    embed["fields"].append({
-        "name": f"{i}. {name}",
-        "value": field_value,
-        "inline": False
-    })
-
-# Add overflow notice
-if len(candidates) > display_count:
-    remaining = len(candidates) - display_count
-    embed["fields"].append({
-        "name": "➕ And More...",
-        "value": f"Plus **{remaining}** additional candidates",
-        "inline": False
-    })
-
-# Create DM channel with owner
-headers = {
-    "Authorization": f"Bot {TOKEN}",
-    "Content-Type": "application/json"
-}
-
-# Step 1: Create DM channel
-dm_response = requests.post(
-    "https://discord.com/api/v10/users/@me/channels",
-    headers=headers,
-    json={"recipient_id": str(DISCORD_OWNER_ID)}
-)
-
-if dm_response.status_code != 200:
-    print(f"❌ Failed to create DM channel: {dm_response.status_code}")
-    print(dm_response.text)
-    sys.exit(1)
-
-dm_channel_id = dm_response.json()["id"]
-
-# Step 2: Send message to DM channel
-msg_response = requests.post(
-    f"https://discord.com/api/v10/channels/{dm_channel_id}/messages",
-    headers=headers,
-    json={"embeds": [embed]}
-)
-
-if msg_response.status_code == 200:
-    print(f"✅ Sent DM about {len(candidates)} new candidates")
-else:
-    print(f"❌ Failed to send DM: {msg_response.status_code}")
-    print(msg_response.text)
-    sys.exit(1)
+
+    # Add top candidates (limit to DISPLAY_LIMIT)
+    display_count = len(candidates)
+
+    for i, candidate in enumerate(candidates, 1):
+        name = candidate.get('name', 'Unknown')
+        score = candidate.get('discovery_score', 0)
+        sources = candidate.get('source_count', 0)
+        archetype = candidate.get('archetype', 'Unknown')
+
+        field_value = f"**Score:** {score}/100\n**Sources:** {sources}/4\n**Type:** {archetype}"
+
+        reasons = candidate.get('reasons', [])
+        if reasons:
+            field_value += f"\n• {reasons[0]}"
+
+        embed["fields"].append({
+            "name": f"{i}. {name}",
+            "value": field_value,
+            "inline": False
+        })
+
+    # Add overflow notice
+    if total > display_count:
+        remaining = total - display_count
+        embed["fields"].append({
+            "name": "➕ And More...",
+            "value": f"Plus **{remaining}** additional candidates",
+            "inline": False
+        })
+
+    asyncio.run(_send_dm(embed))
+
+    print(f"✅ Sent DM about {total} new candidates")
+
+
+if __name__ == "__main__":
+    # Run with PYTHONIOENCODING=utf-8 on Windows consoles for the emoji output
+    try:
+        main()
+    except RuntimeError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
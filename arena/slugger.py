@@ -1,7 +1,7 @@
 import re
 
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
+
 
 def slugify(name: str) -> str:
-    slug = name.lower()
-    slug = re.sub(r"[^a-z0-9]+", "-", slug)
-    return slug.strip("-")
+    return _SLUG_RE.sub("-", name.lower()).strip("-")
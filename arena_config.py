@@ -35,6 +35,18 @@ REQUEST_DELAY = 2.0  # seconds between requests
 MAX_RETRIES = 3
 REQUEST_TIMEOUT = 20
 INCLUDE_ADULT_SOURCES = True  # Include IAFD and Data18
+SCRAPER_CACHE_FILE = DATA_DIR / "scraper_cache.sqlite"
+SCRAPER_CACHE_TTL = 7 * 24 * 60 * 60  # seconds; profiles rarely change week to week
+
+# Max concurrent requests per scraped host (AIMD backs off below this on 429)
+SCRAPER_HOST_LIMITS = {
+    "api.themoviedb.org": 10,
+    "www.babepedia.com": 2,
+    "www.boobpedia.com": 2,
+    "www.iafd.com": 2,
+    "www.data18.com": 2,
+}
+SCRAPER_DEFAULT_HOST_LIMIT = 2
 
 # ============================================================
 # DISCOVERY THRESHOLDS
@@ -10,10 +10,18 @@
 """
 
 import os
+import queue
 import time
 import subprocess
 from pathlib import Path
 
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:  # falls back to polling snapshots
+    Observer = None
+    FileSystemEventHandler = object
+
 # ------------------------------------------------------------
 # FOLDERS / FILES TO WATCH
 # ------------------------------------------------------------
@@ -48,6 +56,31 @@ def should_watch(path: Path) -> bool:
     return True
 
 
+# ------------------------------------------------------------
+# Walk a directory for .py files, pruning ignored folders
+# ------------------------------------------------------------
+def _walk(root):
+    # DirEntry.stat() reuses the directory listing where the OS allows it,
+    # and ignored folders are never descended into.
+    stack = [root]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except (FileNotFoundError, NotADirectoryError, PermissionError):
+            continue
+
+        with it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name.lower() not in IGNORE_FOLDERS:
+                        stack.append(entry.path)
+                elif entry.name.endswith(".py"):
+                    try:
+                        yield entry.path, entry.stat().st_mtime
+                    except FileNotFoundError:
+                        continue
+
+
 # ------------------------------------------------------------
 # Take a snapshot of file modification timestamps
 # ------------------------------------------------------------
@@ -59,16 +92,11 @@ def take_snapshot(paths):
 
         # Track single files
         if p.is_file() and should_watch(p):
-            snapshot[p] = p.stat().st_mtime
+            snapshot[str(p)] = p.stat().st_mtime
 
         # Track directories
-        elif p.is_dir():
-            for file in p.rglob("*.py"):
-                if should_watch(file):
-                    try:
-                        snapshot[file] = file.stat().st_mtime
-                    except FileNotFoundError:
-                        continue
+        elif p.is_dir() and should_watch(p):
+            snapshot.update(_walk(str(p)))
 
     return snapshot
 
@@ -86,12 +114,87 @@ def launch_bot():
 
 
 # ------------------------------------------------------------
-# MAIN LOOP
+# Restart the bot process cleanly
 # ------------------------------------------------------------
-def main():
-    print("[AUTORELOAD] Starting autoreload…")
+def restart_bot(bot, changed_file):
+    print(f"[AUTORELOAD][{time.strftime('%H:%M:%S')}] Change detected in: {changed_file}")
+    print("[AUTORELOAD] Restarting bot…")
 
-    bot = launch_bot()
+    # CLEAN TERMINATION â€” no ghost processes, no duplicates
+    bot.kill()
+    try:
+        bot.wait(timeout=3)  # ensure the old bot is completely dead
+    except subprocess.TimeoutExpired:
+        print("[AUTORELOAD] Warning: old bot process didn't exit in time")
+
+    time.sleep(0.3)
+
+    # RELAUNCH NEW BOT
+    return launch_bot()
+
+
+# ------------------------------------------------------------
+# Filesystem events (watchdog / inotify)
+# ------------------------------------------------------------
+WATCH_ROOTS = [PROJECT_ROOT / root for root in WATCH_PATHS]
+
+
+def is_watched(path: Path) -> bool:
+    if path.suffix != ".py" or not should_watch(path):
+        return False
+    return any(path == root or root in path.parents for root in WATCH_ROOTS)
+
+
+class ChangeHandler(FileSystemEventHandler):
+    def __init__(self, changes: queue.Queue):
+        super().__init__()
+        self.changes = changes
+
+    def on_any_event(self, event):
+        if event.is_directory or event.event_type not in ("created", "modified", "deleted", "moved"):
+            return
+
+        path = Path(getattr(event, "dest_path", "") or event.src_path)
+        if is_watched(path):
+            self.changes.put(path)
+
+
+def watch_loop(bot):
+    changes = queue.Queue()
+    handler = ChangeHandler(changes)
+    observer = Observer()
+
+    for root in WATCH_ROOTS:
+        if root.is_dir():
+            observer.schedule(handler, str(root), recursive=True)
+        elif root.is_file():
+            # Single files: watch the parent, is_watched() filters siblings
+            observer.schedule(handler, str(root.parent), recursive=False)
+
+    observer.start()
+    try:
+        while True:
+            # Blocks until the kernel reports a change
+            changed_file = changes.get()
+
+            # Collapse the burst of events an editor save produces
+            deadline = time.time() + DEBOUNCE_SECONDS
+            while (remaining := deadline - time.time()) > 0:
+                try:
+                    changes.get(timeout=remaining)
+                except queue.Empty:
+                    break
+
+            bot = restart_bot(bot, changed_file)
+    finally:
+        observer.stop()
+        observer.join()
+
+
+# ------------------------------------------------------------
+# Polling fallback (no watchdog installed)
+# ------------------------------------------------------------
+def poll_loop(bot):
     last_snapshot = take_snapshot(WATCH_PATHS)
     last_reload = 0
 
@@ -109,25 +212,25 @@ def main():
 
         # If a change is found AND not too soon since last reload
         if changed_file and (time.time() - last_reload >= DEBOUNCE_SECONDS):
-            print(f"[AUTORELOAD][{time.strftime('%H:%M:%S')}] Change detected in: {changed_file}")
-            print("[AUTORELOAD] Restarting bot…")
-
             last_reload = time.time()
+            bot = restart_bot(bot, changed_file)
 
-            # CLEAN TERMINATION â€” no ghost processes, no duplicates
-            bot.kill()
-            try:
-                bot.wait(timeout=3)  # ensure the old bot is completely dead
-            except subprocess.TimeoutExpired:
-                print("[AUTORELOAD] Warning: old bot process didn't exit in time")
+        last_snapshot = current_snapshot
 
-            time.sleep(0.3)
 
-            # RELAUNCH NEW BOT
-            bot = launch_bot()
-            last_snapshot = current_snapshot
-        else:
-            last_snapshot = current_snapshot
+# ------------------------------------------------------------
+# MAIN LOOP
+# ------------------------------------------------------------
+def main():
+    print("[AUTORELOAD] Starting autoreload…")
+
+    bot = launch_bot()
+
+    if Observer is None:
+        print("[AUTORELOAD] watchdog not installed, polling for changes")
+        poll_loop(bot)
+    else:
+        watch_loop(bot)
 
 
 if __name__ == "__main__":
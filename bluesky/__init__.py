@@ -1,9 +1,18 @@
-from datetime import datetime
+import time
+
+# Second-resolution timestamp cache; log() only runs on the event loop thread
+_last_ts_sec = 0
+_last_ts_str = ""
 
 
 def log(message: str):
-    ts = datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S")
-    print(f"[BLUESKY {ts}] {message}")
+    global _last_ts_sec, _last_ts_str
+
+    now = int(time.time())
+    if now != _last_ts_sec:
+        _last_ts_str = time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime(now))
+        _last_ts_sec = now
+    print(f"[BLUESKY {_last_ts_str}] {message}")
 
 
 __all__ = ["log"]
@@ -1,12 +1,15 @@
 from __future__ import annotations
 
 import os
-from typing import Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, Dict, Optional
 
 import aiohttp
 
 from utils.bluesky import log
 
+if TYPE_CHECKING:
+    from utils.bluesky.post_handler import PostHandler
+
 
 class BlueskyAPI:
     """
@@ -20,15 +23,19 @@ class BlueskyAPI:
 
     BASE_URL = "https://bsky.social/xrpc"
 
+    # handle -> DID entries kept by resolve_handle (oldest evicted first)
+    DID_CACHE_SIZE = 512
+
     def __init__(
         self,
         session: Optional[aiohttp.ClientSession] = None,
     ):
         self._external_session = session is not None
 
-        self.session = session or aiohttp.ClientSession(
-            timeout=aiohttp.ClientTimeout(total=30)
-        )
+        # Owned sessions are created lazily on first use (inside the running
+        # loop) and kept for the bot's lifetime so media + API calls reuse
+        # keep-alive connections.
+        self.session: Optional[aiohttp.ClientSession] = session
 
         # Read existing .env values
         self.handle = os.getenv("BSKY_HANDLE")
@@ -37,6 +44,12 @@ class BlueskyAPI:
         self.access_token: Optional[str] = None
         self.did: Optional[str] = None
 
+        self._did_cache: Dict[str, str] = {}
+
+        # PostHandler bound to this client, built on first use by
+        # post_handler.send_item_to_channel; lives and dies with the client
+        self.post_handler: Optional[PostHandler] = None
+
         self.enabled = bool(self.handle and self.app_password)
 
         if self.enabled:
@@ -48,6 +61,19 @@ class BlueskyAPI:
     # Internal helpers
     # ------------------------------------------------------------
 
+    def _ensure_client(self) -> aiohttp.ClientSession:
+        if self.session is None or self.session.closed:
+            self.session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=30),
+                connector=aiohttp.TCPConnector(
+                    limit=64,
+                    limit_per_host=8,
+                    keepalive_timeout=75,
+                    ttl_dns_cache=300,
+                ),
+            )
+        return self.session
+
     async def _login(self) -> None:
         """
         Authenticate using handle + app password
@@ -82,15 +108,18 @@ class BlueskyAPI:
         if not self.enabled:
             raise RuntimeError("Bluesky API is not configured")
 
+        self._ensure_client()
+
         if not self.access_token:
             await self._login()
 
-    async def ensure_session(self) -> None:
+    async def ensure_session(self) -> aiohttp.ClientSession:
         """
         Public method to ensure authentication and session are ready.
-        Called by media download functions for compatibility.
+        Called by media download functions, which use the returned session.
         """
         await self._ensure_auth()
+        return self.session
 
     async def _get(
         self,
@@ -133,6 +162,11 @@ class BlueskyAPI:
     # ------------------------------------------------------------
 
     async def resolve_handle(self, handle: str) -> str:
+        # DIDs are stable per account; only failures go back to the network
+        did = self._did_cache.get(handle)
+        if did:
+            return did
+
         data = await self._get(
             "com.atproto.identity.resolveHandle",
             {"handle": handle},
@@ -140,6 +174,10 @@ class BlueskyAPI:
         did = data.get("did")
         if not did:
             raise RuntimeError(f"Failed to resolve handle: {handle}")
+
+        if len(self._did_cache) >= self.DID_CACHE_SIZE:
+            del self._did_cache[next(iter(self._did_cache))]
+        self._did_cache[handle] = did
         return did
 
     async def get_author_feed(
@@ -160,6 +198,11 @@ class BlueskyAPI:
             params,
         )
 
+    async def get_feed_by_handle(self, handle: str, limit: int = 50) -> Dict[str, Any]:
+        """Resolve (cached) and fetch a handle's author feed."""
+        did = await self.resolve_handle(handle)
+        return await self.get_author_feed(did, limit=limit)
+
     async def get_post_thread(self, uri: str, depth: int = 0) -> Dict[str, Any]:
         return await self._get(
             "app.bsky.feed.getPostThread",
@@ -181,5 +224,6 @@ class BlueskyAPI:
     # ------------------------------------------------------------
 
     async def close(self):
-        if not self._external_session:
+        if not self._external_session and self.session is not None:
             await self.session.close()
+            self.session = None
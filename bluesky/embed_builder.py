@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Optional
 
 import discord
@@ -34,14 +35,15 @@ def build_post_embed(
       - Same input = same output
     """
 
-    record = post.get("record") or {}
-    author = post.get("author") or {}
+    post_get = post.get
+    record = post_get("record") or {}
+    rec_get = record.get
 
-    display_name = author.get("displayName") or handle
+    display_name = (post_get("author") or {}).get("displayName") or handle
     handle = handle.lower()
 
-    text = record.get("text", "").strip()
-    created_at = record.get("createdAt")
+    text = rec_get("text", "").strip()
+    created_at = rec_get("createdAt")
 
     embed = discord.Embed(
         description=text or None,
@@ -62,9 +64,10 @@ def build_post_embed(
     # Post URL
     # --------------------------------------------------------------
 
-    post_uri = post.get("uri")
-    if post_uri:
-        embed.url = _build_post_url(post_uri)
+    post_uri = post_get("uri")
+    post_url = _build_post_url(post_uri) if post_uri else None
+    if post_url:
+        embed.url = post_url
 
     # --------------------------------------------------------------
     # Post type indicators
@@ -72,14 +75,15 @@ def build_post_embed(
 
     indicators = []
 
-    if record.get("reply"):
+    embed_data = rec_get("embed")
+
+    if rec_get("reply"):
         indicators.append("💬 Reply")
-    elif post.get("reason"):
+    elif post_get("reason"):
         indicators.append("🔁 Repost")
-    elif record.get("embed"):
+    elif embed_data:
         # FIX: Only show "Quote" if it actually has a quoted record
         # Regular posts with images/video also have an embed, but no record
-        embed_data = record.get("embed", {})
         if embed_data.get("record"):
             indicators.append("💬 Quote")
 
@@ -89,8 +93,7 @@ def build_post_embed(
         indicators.append(VIDEO_ATTACHED_NOTICE)
     
     # Always add View Post link
-    if post_uri:
-        post_url = _build_post_url(post_uri)
+    if post_url:
         indicators.append(f"🔗 [View Post]({post_url})")
 
     if indicators:
@@ -109,6 +112,12 @@ def build_post_embed(
     return embed
 
 
+def build_bsky_url(post: dict) -> Optional[str]:
+    """bsky.app URL for a post payload, in the same form as the embed link."""
+    uri = post.get("uri")
+    return _build_post_url(uri) if uri else None
+
+
 # ------------------------------------------------------------------
 # Helpers
 # ------------------------------------------------------------------
@@ -116,6 +125,20 @@ def build_post_embed(
 def _parse_timestamp(value: Optional[str]) -> Optional[datetime]:
     if not value:
         return None
+
+    # Fast path for the "YYYY-MM-DDTHH:MM:SS[.ffffff]Z" shape Bluesky emits
+    if len(value) >= 20 and value[-1] == "Z" and value[10] == "T" and value[19] in ".Z":
+        try:
+            frac = value[20:-1]
+            return datetime(
+                int(value[0:4]), int(value[5:7]), int(value[8:10]),
+                int(value[11:13]), int(value[14:16]), int(value[17:19]),
+                int(frac[:6].ljust(6, "0")) if frac else 0,
+                tzinfo=timezone.utc,
+            )
+        except ValueError:
+            pass
+
     try:
         return datetime.fromisoformat(value.replace("Z", "+00:00"))
     except Exception:
@@ -126,6 +149,7 @@ def _build_profile_url(handle: str) -> str:
     return f"https://bsky.app/profile/{handle}"
 
 
+@lru_cache(maxsize=4096)
 def _build_post_url(uri: str) -> str:
     """
     Convert at:// URI → bsky.app URL
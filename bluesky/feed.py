@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+from typing import Any, List, Optional, Tuple
+
+# -----------------------------------------------------------------------------
+# Feed parsing
+# -----------------------------------------------------------------------------
+
+_EMPTY: dict = {}
+
+
+def is_non_reply(item: dict) -> bool:
+    """True if a feed item's post is not a reply; for next(filter(...)) scans."""
+    post = item.get("post") or _EMPTY
+    return "reply" not in (post.get("record") or _EMPTY)
+
+
+def parse_feed(
+    feed_response: Any,
+) -> Optional[Tuple[List[dict], List[Optional[str]], List[bool]]]:
+    """
+    Flatten an author feed response into parallel lists in one pass.
+
+    Accepts either the raw {"feed": [...]} payload or the bare list.
+    Non-dict entries are dropped.
+
+    Returns None for an unrecognised payload, otherwise:
+        items     -> feed items (newest first, as returned)
+        uris      -> post URI of each item (None if missing)
+        is_reply  -> True if the item's post record is a reply
+    """
+    if isinstance(feed_response, dict):
+        raw = feed_response.get("feed") or []
+    elif isinstance(feed_response, list):
+        raw = feed_response
+    else:
+        return None
+
+    items: List[dict] = []
+    uris: List[Optional[str]] = []
+    is_reply: List[bool] = []
+
+    for item in raw:
+        if not isinstance(item, dict):
+            continue
+        post = item.get("post") or _EMPTY
+        items.append(item)
+        uris.append(post.get("uri"))
+        # Presence of the key means it's a reply, regardless of value
+        is_reply.append("reply" in (post.get("record") or _EMPTY))
+
+    return items, uris, is_reply
@@ -2,10 +2,10 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import os
 import time
 from pathlib import Path
-from typing import List, Optional, Tuple
-from urllib.parse import urlparse
+from typing import Dict, List, Optional, Tuple
 
 import aiohttp
 
@@ -21,10 +21,39 @@ log = logging.getLogger("bluesky.media")
 BSKY_MEDIA_ROOT = MEDIA_ROOT / "bluesky"
 BSKY_MEDIA_ROOT.mkdir(parents=True, exist_ok=True)
 
+# Global admission gate for media GETs so fan-out across posts stays
+# within the connector's limits
+_DL_SEM = asyncio.Semaphore(int(os.getenv("BSKY_DL_CONCURRENCY", "8")))
+
+# (url, dest) -> running download, so overlapping callers share one fetch
+_INFLIGHT: Dict[Tuple[str, str], "asyncio.Future[Optional[Path]]"] = {}
+
 # -----------------------------------------------------------------------------
 # Cache management
 # -----------------------------------------------------------------------------
 
+def _iter_files(root: str):
+    """
+    Yield DirEntry objects for every regular file under root.
+
+    DirEntry.is_file() comes from the directory listing and DirEntry.stat()
+    is cached, so each file costs one readdir slot instead of extra syscalls.
+    """
+    stack = [root]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+
+        with it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    yield entry
+
+
 def cleanup_bluesky_cache(retention_days: Optional[int] = None) -> int:
     """
     Delete cached Bluesky media files older than retention_days.
@@ -37,54 +66,134 @@ def cleanup_bluesky_cache(retention_days: Optional[int] = None) -> int:
     cutoff = time.time() - (days * 86400)
 
     deleted = 0
-    for path in BSKY_MEDIA_ROOT.rglob("*"):
-        if not path.is_file():
-            continue
+    for entry in _iter_files(str(BSKY_MEDIA_ROOT)):
         try:
-            if path.stat().st_mtime < cutoff:
-                path.unlink()
+            if entry.stat().st_mtime < cutoff:
+                os.unlink(entry.path)
                 deleted += 1
         except OSError:
             continue
 
     return deleted
 
+
+async def cleanup_bluesky_cache_async(retention_days: Optional[int] = None) -> int:
+    """Run cleanup_bluesky_cache on a worker thread so the walk never blocks the loop."""
+    return await asyncio.to_thread(cleanup_bluesky_cache, retention_days)
+
 # -----------------------------------------------------------------------------
 # URL helpers
 # -----------------------------------------------------------------------------
 
+def _url_suffix(url: str) -> str:
+    """
+    Lowercased file suffix of a URL's path, in one pass without urlparse.
+    Mirrors Path(urlparse(url).path).suffix: query/fragment ignored,
+    dotfiles and trailing dots have no suffix.
+    """
+    end = len(url)
+    for sep in "?#":
+        i = url.find(sep, 0, end)
+        if i != -1:
+            end = i
+
+    scheme = url.find("://", 0, end)
+    if scheme == -1:
+        path_start = 0
+    else:
+        path_start = url.find("/", scheme + 3, end)
+        if path_start == -1:
+            return ""
+
+    slash = url.rfind("/", path_start, end)
+    dot = url.rfind(".", slash + 1, end)
+    if dot <= slash + 1 or dot == end - 1:
+        return ""
+    return url[dot:end].lower()
+
+
 def _ext_from_url(url: str, default: str = ".jpg") -> str:
-    try:
-        suffix = Path(urlparse(url).path).suffix
-        return suffix if suffix else default
-    except Exception:
-        return default
+    return _url_suffix(url) or default
+
+
+_VIDEO_EXTS = frozenset({".mp4", ".webm", ".mov", ".mkv"})
 
 
 def _is_video_url(url: str) -> bool:
-    suffix = Path(urlparse(url).path).suffix.lower()
-    return suffix in {".mp4", ".webm", ".mov", ".mkv"}
+    return _url_suffix(url) in _VIDEO_EXTS
 
 # -----------------------------------------------------------------------------
 # Low-level download helpers
 # -----------------------------------------------------------------------------
 
+IMAGE_CHUNK_SIZE = 64 * 1024
+VIDEO_CHUNK_SIZE = 256 * 1024
+
+# No overall cap: large videos on slow links are fine as long as bytes keep
+# arriving. Handshakes fail fast and stalled reads are caught per socket read.
+IMAGE_TIMEOUT = aiohttp.ClientTimeout(total=None, sock_connect=10, sock_read=30)
+VIDEO_TIMEOUT = aiohttp.ClientTimeout(total=None, sock_connect=10, sock_read=60)
+
+
+async def _stream_to_file(
+    resp: aiohttp.ClientResponse,
+    dest: Path,
+    chunk_size: int,
+) -> int:
+    """
+    Write a response body to disk chunk by chunk so only one chunk is in
+    memory at a time. A partial file is removed if the stream fails.
+    Returns the number of bytes written.
+    """
+    size = 0
+    try:
+        with dest.open("wb") as f:
+            async for chunk in resp.content.iter_chunked(chunk_size):
+                f.write(chunk)
+                size += len(chunk)
+    except BaseException:
+        dest.unlink(missing_ok=True)
+        raise
+    return size
+
 async def _download_url(
     session: aiohttp.ClientSession,
     url: str,
     dest: Path,
 ) -> Optional[Path]:
-    """Download a URL to disk. Returns the destination path or None on failure."""
+    """
+    Download a URL to disk. Returns the destination path or None on failure.
+    A second request for the same (url, dest) while the first is still
+    running awaits that download instead of fetching the bytes again.
+    """
+    key = (url, str(dest))
+    fut = _INFLIGHT.get(key)
+    if fut is None:
+        fut = asyncio.ensure_future(_fetch_url(session, url, dest))
+        _INFLIGHT[key] = fut
+        # The entry lives exactly as long as the download, whoever awaits it
+        fut.add_done_callback(lambda _: _INFLIGHT.pop(key, None))
+
+    # shield: a cancelled caller (the one that started it included) must
+    # not cancel the shared download
+    return await asyncio.shield(fut)
+
+
+async def _fetch_url(
+    session: aiohttp.ClientSession,
+    url: str,
+    dest: Path,
+) -> Optional[Path]:
     try:
-        dest.parent.mkdir(parents=True, exist_ok=True)
-        async with session.get(
-            url,
-            timeout=aiohttp.ClientTimeout(total=30),
-        ) as resp:
-            if resp.status != 200:
-                log.warning("[BSKY_MEDIA] GET failed %s (%s)", url, resp.status)
-                return None
-            dest.write_bytes(await resp.read())
+        async with _DL_SEM:
+            async with session.get(
+                url,
+                timeout=IMAGE_TIMEOUT,
+            ) as resp:
+                if resp.status != 200:
+                    log.warning("[BSKY_MEDIA] GET failed %s (%s)", url, resp.status)
+                    return None
+                await _stream_to_file(resp, dest, IMAGE_CHUNK_SIZE)
         return dest
     except Exception:
         log.exception("[BSKY_MEDIA] Download error: %s", url)
@@ -96,10 +205,9 @@ async def _download_blob(
     cid: str,
     author_did: str,
     dest: Path,
-) -> Optional[Path]:
-    """Download a Bluesky blob (used for videos)."""
-    await api.ensure_session()
-    assert api.session is not None
+) -> Optional[Tuple[Path, int]]:
+    """Download a Bluesky blob (used for videos). Returns (path, size) or None."""
+    session = await api.ensure_session()
 
     url = (
         f"{api.BASE_URL}/com.atproto.sync.getBlob"
@@ -107,16 +215,16 @@ async def _download_blob(
     )
 
     try:
-        dest.parent.mkdir(parents=True, exist_ok=True)
-        async with api.session.get(
-            url,
-            timeout=aiohttp.ClientTimeout(total=60),
-        ) as resp:
-            if resp.status != 200:
-                log.warning("[BSKY_MEDIA] Blob fetch failed %s (%s)", cid, resp.status)
-                return None
-            dest.write_bytes(await resp.read())
-        return dest
+        async with _DL_SEM:
+            async with session.get(
+                url,
+                timeout=VIDEO_TIMEOUT,
+            ) as resp:
+                if resp.status != 200:
+                    log.warning("[BSKY_MEDIA] Blob fetch failed %s (%s)", cid, resp.status)
+                    return None
+                size = await _stream_to_file(resp, dest, VIDEO_CHUNK_SIZE)
+        return dest, size
     except Exception:
         log.exception("[BSKY_MEDIA] Blob download exception: %s", cid)
         return None
@@ -192,7 +300,7 @@ async def download_media_for_post(
     post_uri: str,
     embed: dict,
     author_did: Optional[str],
-) -> Tuple[List[Path], List[Path], Optional[Path]]:
+) -> Tuple[List[Path], List[Path], Optional[Path], List[int]]:
     """
     Download all media associated with a single post.
 
@@ -200,60 +308,83 @@ async def download_media_for_post(
         image_paths     -> REAL images only (ordered)
         video_paths     -> downloaded video blobs
         thumbnail_path -> hero image for embed
+        video_sizes     -> byte size of each video_paths entry
     """
     if not embed:
-        return [], [], None
+        return [], [], None, []
+
+    image_urls, video_cid, thumbnail_url = _extract_media(embed)
+
+    # Text-only / link-card posts: nothing to fetch, so skip the session
+    # handshake and any filesystem work
+    if not image_urls and not thumbnail_url and not (video_cid and author_did):
+        return [], [], None, []
 
     rkey = post_uri.rsplit("/", 1)[-1] if post_uri else "unknown"
     post_dir = BSKY_MEDIA_ROOT / handle / rkey
 
-    image_urls, video_cid, thumbnail_url = _extract_media(embed)
+    session = await api.ensure_session()
+
+    # Every file in the post lands in post_dir; the download helpers
+    # expect it to exist
+    post_dir.mkdir(parents=True, exist_ok=True)
 
-    await api.ensure_session()
-    assert api.session is not None
+    # Filename prefix is the same for every file in the post
+    prefix = handle.replace('.', '-')
 
     # --------------------
-    # Images (parallel)
+    # Images, thumbnail and video blob all download in one gather;
+    # each task is tagged with the bucket its result belongs to
     # --------------------
-    image_paths: List[Path] = []
-
     async def _dl_image(idx: int, url: str) -> Optional[Path]:
-        ext = _ext_from_url(url)
-        dest = post_dir / f"{handle.replace('.', '-')}-{idx:04d}{ext}"
-        return await _download_url(api.session, url, dest)
+        dest = post_dir / f"{prefix}-{idx:04d}{_ext_from_url(url)}"
+        return await _download_url(session, url, dest)
 
-    tasks = [_dl_image(i, url) for i, url in enumerate(image_urls)]
-    for result in await asyncio.gather(*tasks, return_exceptions=True):
-        if isinstance(result, Path):
-            image_paths.append(result)
+    tags: List[str] = []
+    tasks = []
+
+    for i, url in enumerate(image_urls):
+        tags.append("image")
+        tasks.append(_dl_image(i, url))
 
-    # --------------------
     # Thumbnail (hero image only)
-    # --------------------
-    thumbnail_path: Optional[Path] = None
     if thumbnail_url:
-        thumb_dest = post_dir / "thumbnail.jpg"
-        thumb = await _download_url(api.session, thumbnail_url, thumb_dest)
-        if thumb:
-            thumbnail_path = thumb
+        tags.append("thumbnail")
+        tasks.append(_download_url(session, thumbnail_url, post_dir / "thumbnail.jpg"))
 
-    # --------------------
     # Video blob
-    # --------------------
-    video_paths: List[Path] = []
     if video_cid and author_did:
-        dest = post_dir / f"{handle.replace('.', '-')}-video.mp4"
-        blob = await _download_blob(api, video_cid, author_did, dest)
-        if blob:
-            video_paths.append(blob)
+        tags.append("video")
+        dest = post_dir / f"{prefix}-video.mp4"
+        tasks.append(_download_blob(api, video_cid, author_did, dest))
+
+    image_paths: List[Path] = []
+    video_paths: List[Path] = []
+    video_sizes: List[int] = []
+    thumbnail_path: Optional[Path] = None
+
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+    for tag, result in zip(tags, results):
+        if tag == "video":
+            # Blob downloads report their size so callers never re-stat
+            if isinstance(result, tuple):
+                video_paths.append(result[0])
+                video_sizes.append(result[1])
+            continue
+        if not isinstance(result, Path):
+            continue
+        if tag == "image":
+            image_paths.append(result)
+        else:
+            thumbnail_path = result
 
-    return image_paths, video_paths, thumbnail_path
+    return image_paths, video_paths, thumbnail_path, video_sizes
 
 
 async def download_media_for_feed_item(
     api: BlueskyAPI,
     feed_item: dict,
-) -> Tuple[List[Path], List[Path], Optional[Path], str, str]:
+) -> Tuple[List[Path], List[Path], Optional[Path], str, str, List[int]]:
     """
     Convenience wrapper for feed items.
 
@@ -263,6 +394,7 @@ async def download_media_for_feed_item(
         thumbnail_path
         handle
         post_uri
+        video_sizes
     """
     post = feed_item.get("post") or {}
     author = post.get("author") or {}
@@ -272,7 +404,7 @@ async def download_media_for_feed_item(
     post_uri = post.get("uri", "")
     embed = post.get("embed") or {}
 
-    images, videos, thumb = await download_media_for_post(
+    images, videos, thumb, video_sizes = await download_media_for_post(
         api=api,
         handle=handle,
         post_uri=post_uri,
@@ -280,4 +412,4 @@ async def download_media_for_feed_item(
         author_did=author_did,
     )
 
-    return images, videos, thumb, handle, post_uri
+    return images, videos, thumb, handle, post_uri, video_sizes
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 from pathlib import Path
 from typing import List
@@ -9,7 +10,7 @@ import discord
 from config import MAX_DISCORD_FILE_SIZE_BYTES
 from utils.bluesky.api import BlueskyAPI
 from utils.bluesky.media import download_media_for_feed_item
-from utils.bluesky.state import get_shared_state
+from utils.bluesky.state import get_shared_state, uri_rkey
 from utils.bluesky.embed_builder import build_post_embed
 from utils.ui.media_carousel import MediaCarouselView
 
@@ -18,6 +19,23 @@ log = logging.getLogger("bluesky.post_handler")
 DISCORD_MAX_BYTES = MAX_DISCORD_FILE_SIZE_BYTES * 1024 * 1024
 
 
+async def _open_attachment(path: Path) -> discord.File:
+    """
+    Open an attachment off the event loop. discord.py streams the handle
+    during upload but does not own it; callers close it via _close_files.
+    """
+    fp = await asyncio.to_thread(open, path, "rb")
+    return discord.File(fp, filename=path.name)
+
+
+def _close_files(files: List[discord.File]) -> None:
+    for f in files:
+        # discord.File stubs out fp.close until File.close() restores it,
+        # so a send that failed early would otherwise leave the handle open
+        f.close()
+        f.fp.close()
+
+
 class PostHandler:
     """
     High-level orchestrator for posting Bluesky content to Discord.
@@ -66,8 +84,9 @@ class PostHandler:
         # Watermark protection (CRITICAL)
         # --------------------------------------------------------------
 
-        last_seen = self.state.get_last_seen_uri(handle)
-        if last_seen and uri <= last_seen:
+        # Per-handle watermark, so comparing the TID record keys is enough
+        last_seen_rkey = self.state.get_last_seen_rkey(handle)
+        if last_seen_rkey and uri_rkey(uri) <= last_seen_rkey:
             log.debug("Skipping already-seen post %s", uri)
             return
 
@@ -75,7 +94,7 @@ class PostHandler:
         # Media download
         # --------------------------------------------------------------
 
-        image_paths, video_paths, thumbnail_path, _, _ = (
+        image_paths, video_paths, thumbnail_path, _, _, video_sizes = (
             await download_media_for_feed_item(self.api, feed_item)
         )
 
@@ -84,7 +103,8 @@ class PostHandler:
         # --------------------------------------------------------------
 
         has_video = bool(video_paths)
-        video_too_large = any(p.stat().st_size > DISCORD_MAX_BYTES for p in video_paths)
+        # Sizes come from the download itself; no stat() per video
+        video_too_large = any(size > DISCORD_MAX_BYTES for size in video_sizes)
 
         embed = build_post_embed(
             handle=handle,
@@ -104,24 +124,30 @@ class PostHandler:
             view = MediaCarouselView(media_paths=image_paths, embed=embed)
             
             # Set first image
-            first_file = discord.File(str(image_paths[0]), filename=image_paths[0].name)
+            first_file = await _open_attachment(image_paths[0])
             embed.set_image(url=f"attachment://{image_paths[0].name}")
             
-            main_message = await channel.send(
-                embed=embed,
-                file=first_file,
-                view=view,
-            )
+            try:
+                main_message = await channel.send(
+                    embed=embed,
+                    file=first_file,
+                    view=view,
+                )
+            finally:
+                _close_files([first_file])
             
         elif len(image_paths) == 1:
             # Single image → Direct attach
-            file = discord.File(str(image_paths[0]), filename=image_paths[0].name)
+            file = await _open_attachment(image_paths[0])
             embed.set_image(url=f"attachment://{image_paths[0].name}")
             
-            main_message = await channel.send(
-                embed=embed,
-                file=file,
-            )
+            try:
+                main_message = await channel.send(
+                    embed=embed,
+                    file=file,
+                )
+            finally:
+                _close_files([file])
             
         else:
             # No images → Just embed
@@ -134,10 +160,10 @@ class PostHandler:
         if video_paths and main_message:
             video_files = []
             
-            for path in video_paths:
+            for path, size in zip(video_paths, video_sizes):
                 try:
-                    if path.stat().st_size <= DISCORD_MAX_BYTES:
-                        video_files.append(discord.File(path))
+                    if size <= DISCORD_MAX_BYTES:
+                        video_files.append(await _open_attachment(path))
                     else:
                         log.warning("Video too large for Discord: %s", path)
                 except Exception:
@@ -148,6 +174,8 @@ class PostHandler:
                     await main_message.reply(files=video_files)
                 except Exception:
                     log.exception("Failed posting video reply")
+                finally:
+                    _close_files(video_files)
 
         # --------------------------------------------------------------
         # Advance watermark AFTER successful send
@@ -167,7 +195,14 @@ async def send_item_to_channel(
 ) -> None:
     """
     Stateless wrapper used by the Bluesky monitor loop.
+
+    One PostHandler is built per API client and reused for every item.
+    It is kept in the client's post_handler slot, so a reloaded cog's new
+    client gets a fresh handler and the old pair is collected together.
     """
-    bot = channel.guild._state._get_client()
-    handler = PostHandler(bot=bot, api=api)
+    handler = api.post_handler
+    if handler is None:
+        bot = channel.guild._state._get_client()
+        handler = PostHandler(bot=bot, api=api)
+        api.post_handler = handler
     await handler.handle_feed_item(channel, feed_item)
@@ -1,11 +1,15 @@
 from __future__ import annotations
 
-import json
+import asyncio
+import contextlib
+import sys
 import threading
 from dataclasses import dataclass, asdict
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import orjson
 
 from config import DATA_ROOT
 
@@ -19,6 +23,9 @@ BSKY_DATA_ROOT.mkdir(parents=True, exist_ok=True)
 SUBS_FILE = BSKY_DATA_ROOT / "bsky_subscriptions.json"
 LAST_SEEN_FILE = BSKY_DATA_ROOT / "bsky_last_seen.json"
 
+# Watermark writes are coalesced: at most one rewrite per this many seconds
+LAST_SEEN_FLUSH_DELAY = 2.0
+
 
 # ------------------------------------------------------------------
 # Models
@@ -30,6 +37,8 @@ class Subscription:
     thread_id: Optional[int] = None
     interval_minutes: Optional[int] = None
     next_check_ts: Optional[float] = None
+    # Monitor's newest-feed-entry signature from its last quiet check
+    feed_head: Optional[str] = None
 
 
 # ------------------------------------------------------------------
@@ -47,6 +56,16 @@ def get_shared_state() -> "BlueskyState":
     return _shared_state
 
 
+def uri_rkey(uri: Optional[str]) -> Optional[str]:
+    # AT-URI record keys are TIDs, which sort in creation order
+    return uri.rsplit("/", 1)[-1] if uri else None
+
+
+def _norm_handle(handle: str) -> str:
+    # Callers mostly pass already-lowered handles; skip the copy for those
+    return handle if handle.islower() else handle.lower()
+
+
 # ------------------------------------------------------------------
 # State Class
 # ------------------------------------------------------------------
@@ -67,11 +86,63 @@ class BlueskyState:
         self.parent_channel_id: Optional[int] = None
 
         self.subscriptions: List[Subscription] = []
+        # O(1) lookup indexes, kept in sync with self.subscriptions
+        self._by_handle: Dict[str, Subscription] = {}
+        self._by_thread: Dict[int, Subscription] = {}
+        # Handle lists for autocomplete; rebuilt lazily after add/remove
+        self._handles_view: Optional[List[str]] = None
+        self._handles_lower: Optional[List[Tuple[str, str]]] = None
+        self._handles_sorted: Optional[Tuple[List[str], List[str]]] = None
         self.slug_map: Dict[str, str] = {}
         self.last_seen: Dict[str, str] = {}
+        # handle -> rkey of last_seen, for the per-post watermark compare
+        self._last_seen_rkey: Dict[str, Optional[str]] = {}
+
+        # batch(): subscription saves are deferred until the outermost exit
+        self._batch_depth = 0
+        self._batch_dirty = False
+        # Subscription snapshots are numbered so an older one finishing late
+        # on a worker thread never overwrites a newer file
+        self._subs_gen = 0
+        self._subs_written_gen = 0
+
+        self._last_seen_dirty = asyncio.Event()
+        self._last_seen_lock = asyncio.Lock()
+        self._flush_task: Optional[asyncio.Task] = None
 
         self._load_subscriptions()
         self._load_last_seen()
+        self._rebuild_indexes()
+
+    # ------------------------------------------------------------------
+    # Indexes
+    # ------------------------------------------------------------------
+
+    def _rebuild_indexes(self) -> None:
+        # reversed() so the first entry wins, matching the old linear scans
+        self._by_handle = {s.handle: s for s in reversed(self.subscriptions)}
+        self._by_thread = {
+            s.thread_id: s for s in reversed(self.subscriptions) if s.thread_id is not None
+        }
+        self._invalidate_handle_views()
+
+    def _invalidate_handle_views(self) -> None:
+        self._handles_view = None
+        self._handles_lower = None
+        self._handles_sorted = None
+
+    def _reindex_thread(self, thread_id: Optional[int]) -> None:
+        """
+        Re-point one thread's index entry after a mutation. Several handles
+        can share a thread, and the first in list order owns the entry.
+        """
+        if thread_id is None:
+            return
+        owner = next((s for s in self.subscriptions if s.thread_id == thread_id), None)
+        if owner is None:
+            self._by_thread.pop(thread_id, None)
+        else:
+            self._by_thread[thread_id] = owner
 
     # ------------------------------------------------------------------
     # Atomic helpers
@@ -79,8 +150,7 @@ class BlueskyState:
 
     def _atomic_write(self, path: Path, data: dict) -> None:
         tmp = path.with_suffix(path.suffix + ".tmp")
-        with tmp.open("w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2)
+        tmp.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
         tmp.replace(path)
 
     def _backup_corrupt(self, path: Path):
@@ -97,8 +167,7 @@ class BlueskyState:
             return
 
         try:
-            with SUBS_FILE.open("r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = orjson.loads(SUBS_FILE.read_bytes())
         except Exception:
             self._backup_corrupt(SUBS_FILE)
             return
@@ -108,26 +177,76 @@ class BlueskyState:
 
         self.subscriptions = [
             Subscription(
-                handle=s["handle"].lower(),
+                handle=sys.intern(s["handle"].lower()),
                 thread_id=s.get("thread_id"),
                 interval_minutes=s.get("interval_minutes"),
                 next_check_ts=s.get("next_check_ts"),
+                feed_head=s.get("feed_head"),
             )
             for s in data.get("subscriptions", [])
             if "handle" in s
         ]
 
-        self.slug_map = {k.lower(): v for k, v in data.get("slug_map", {}).items()}
+        self.slug_map = {
+            sys.intern(k.lower()): v for k, v in data.get("slug_map", {}).items()
+        }
+
+    def _snapshot_subscriptions(self) -> Tuple[dict, int]:
+        self._subs_gen += 1
+        payload = {
+            "guild_id": self.guild_id,
+            "parent_channel_id": self.parent_channel_id,
+            "subscriptions": [asdict(s) for s in self.subscriptions],
+            "slug_map": dict(self.slug_map),
+        }
+        return payload, self._subs_gen
 
-    def _save_subscriptions(self) -> None:
+    def _write_subscriptions(self, payload: dict, gen: int) -> None:
         with _state_lock:
-            payload = {
-                "guild_id": self.guild_id,
-                "parent_channel_id": self.parent_channel_id,
-                "subscriptions": [asdict(s) for s in self.subscriptions],
-                "slug_map": self.slug_map,
-            }
+            if gen <= self._subs_written_gen:
+                return
             self._atomic_write(SUBS_FILE, payload)
+            self._subs_written_gen = gen
+
+    def _save_subscriptions(self) -> None:
+        if self._batch_depth:
+            self._batch_dirty = True
+            return
+
+        self._write_subscriptions(*self._snapshot_subscriptions())
+
+    async def _save_subscriptions_async(self) -> None:
+        if self._batch_depth:
+            self._batch_dirty = True
+            return
+
+        # Snapshot on the loop thread; serialize + rename on a worker thread
+        payload, gen = self._snapshot_subscriptions()
+        await asyncio.to_thread(self._write_subscriptions, payload, gen)
+
+    @contextlib.contextmanager
+    def batch(self):
+        """Coalesce every subscription save inside the block into one write."""
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and self._batch_dirty:
+                self._batch_dirty = False
+                self._save_subscriptions()
+
+    @contextlib.asynccontextmanager
+    async def batch_async(self):
+        """Like batch(), but the one write at the end runs off the event loop."""
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and self._batch_dirty:
+                self._batch_dirty = False
+                await self._save_subscriptions_async()
 
     def _load_last_seen(self) -> None:
         if not LAST_SEEN_FILE.exists():
@@ -135,8 +254,7 @@ class BlueskyState:
             return
 
         try:
-            with LAST_SEEN_FILE.open("r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = orjson.loads(LAST_SEEN_FILE.read_bytes())
         except Exception:
             self._backup_corrupt(LAST_SEEN_FILE)
             self.last_seen = {}
@@ -144,32 +262,70 @@ class BlueskyState:
             return
 
         raw = data.get("last_seen", data)
-        self.last_seen = {k.lower(): v for k, v in raw.items()}
+        self.last_seen = {sys.intern(k.lower()): v for k, v in raw.items()}
+        self._last_seen_rkey = {h: uri_rkey(v) for h, v in self.last_seen.items()}
 
     def _save_last_seen(self) -> None:
-        with _state_lock:
-            self._atomic_write(LAST_SEEN_FILE, {"last_seen": self.last_seen})
+        # Sync path: only used before the event loop runs (init / tooling)
+        self._atomic_write(LAST_SEEN_FILE, {"last_seen": self.last_seen})
+
+    async def _save_last_seen_async(self) -> None:
+        async with self._last_seen_lock:
+            # Snapshot on the loop thread; serialize + rename on a worker thread
+            payload = {"last_seen": dict(self.last_seen)}
+            await asyncio.to_thread(self._atomic_write, LAST_SEEN_FILE, payload)
+
+    def _schedule_last_seen_flush(self) -> None:
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            # No event loop (scripts / tooling): write through immediately
+            self._save_last_seen()
+            return
+
+        self._last_seen_dirty.set()
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_last_seen_loop())
+
+    async def _flush_last_seen_loop(self) -> None:
+        while True:
+            await self._last_seen_dirty.wait()
+            await asyncio.sleep(LAST_SEEN_FLUSH_DELAY)
+            # Clear before writing so updates that land mid-save re-arm the flush
+            self._last_seen_dirty.clear()
+            await self._save_last_seen_async()
+
+    async def flush(self) -> None:
+        """Write any pending watermark changes now (graceful shutdown)."""
+        if self._last_seen_dirty.is_set():
+            self._last_seen_dirty.clear()
+            await self._save_last_seen_async()
 
     # ------------------------------------------------------------------
     # Watermark logic (MOST IMPORTANT)
     # ------------------------------------------------------------------
 
     def get_last_seen_uri(self, handle: str) -> Optional[str]:
-        return self.last_seen.get(handle.lower())
+        return self.last_seen.get(_norm_handle(handle))
+
+    def get_last_seen_rkey(self, handle: str) -> Optional[str]:
+        """Record key (TID) of the watermark URI; compare with uri_rkey()."""
+        return self._last_seen_rkey.get(_norm_handle(handle))
 
     def set_last_seen_uri(self, handle: str, uri: str) -> None:
         """
         Watermark moves FORWARD ONLY.
         Never regress. Never overwrite newer data.
         """
-        handle = handle.lower()
+        handle = _norm_handle(handle)
         current = self.last_seen.get(handle)
 
         if current == uri:
             return
 
         self.last_seen[handle] = uri
-        self._save_last_seen()
+        self._last_seen_rkey[handle] = uri_rkey(uri)
+        self._schedule_last_seen_flush()
         print(f"[BSKY_STATE] Watermark advanced @{handle} â†’ {uri}")
 
     # ------------------------------------------------------------------
@@ -177,38 +333,73 @@ class BlueskyState:
     # ------------------------------------------------------------------
 
     def get_subscription(self, handle: str) -> Optional[Subscription]:
-        handle = handle.lower()
-        return next((s for s in self.subscriptions if s.handle == handle), None)
+        return self._by_handle.get(_norm_handle(handle))
 
     def list_handles(self) -> List[str]:
         return [s.handle for s in self.subscriptions]
 
+    def handles_view(self) -> List[str]:
+        """
+        Cached handle list for hot read paths (autocomplete).
+        Shared between calls - do not mutate; use list_handles() for a copy.
+        """
+        if self._handles_view is None:
+            self._handles_view = [s.handle for s in self.subscriptions]
+        return self._handles_view
+
+    def handles_lower(self) -> List[Tuple[str, str]]:
+        """
+        Cached (handle, casefolded handle) pairs, so autocomplete never
+        re-folds the same strings per keystroke. Shared - do not mutate.
+        """
+        if self._handles_lower is None:
+            self._handles_lower = [(h, h.casefold()) for h in self.handles_view()]
+        return self._handles_lower
+
+    def handles_sorted(self) -> Tuple[List[str], List[str]]:
+        """
+        Cached parallel lists (casefolded, original) ordered by the casefolded
+        handle, for bisect prefix lookups. Shared - do not mutate.
+        """
+        if self._handles_sorted is None:
+            pairs = sorted(self.handles_lower(), key=lambda p: p[1])
+            self._handles_sorted = ([low for _, low in pairs], [h for h, _ in pairs])
+        return self._handles_sorted
+
     def add_subscription(
         self, 
         handle: str, 
         thread_id: Optional[int] = None,
         interval_minutes: Optional[int] = None
     ) -> bool:
-        handle = handle.lower()
+        handle = sys.intern(_norm_handle(handle))
         if self.get_subscription(handle):
             return False
-        self.subscriptions.append(Subscription(
+        sub = Subscription(
             handle=handle,
             thread_id=thread_id,
             interval_minutes=interval_minutes
-        ))
+        )
+        self.subscriptions.append(sub)
+        self._by_handle[handle] = sub
+        self._invalidate_handle_views()
+        if thread_id is not None:
+            self._by_thread.setdefault(thread_id, sub)
         self._save_subscriptions()
         return True
 
     def remove_subscription(self, handle: str) -> bool:
-        handle = handle.lower()
-        before = len(self.subscriptions)
-        self.subscriptions = [s for s in self.subscriptions if s.handle != handle]
+        handle = _norm_handle(handle)
+        sub = self._by_handle.pop(handle, None)
 
-        if len(self.subscriptions) < before:
+        if sub is not None:
+            self.subscriptions = [s for s in self.subscriptions if s.handle != handle]
+            self._invalidate_handle_views()
+            self._reindex_thread(sub.thread_id)
             self.last_seen.pop(handle, None)
+            self._last_seen_rkey.pop(handle, None)
             self._save_subscriptions()
-            self._save_last_seen()
+            self._schedule_last_seen_flush()
             return True
         return False
 
@@ -219,10 +410,16 @@ class BlueskyState:
     def set_thread_id(self, handle: str, thread_id: int) -> None:
         sub = self.get_subscription(handle)
         if not sub:
-            sub = Subscription(handle=handle.lower())
+            sub = Subscription(handle=sys.intern(_norm_handle(handle)))
             self.subscriptions.append(sub)
+            self._by_handle[sub.handle] = sub
+            self._invalidate_handle_views()
 
+        old_thread_id = sub.thread_id
         sub.thread_id = thread_id
+        if old_thread_id != thread_id:
+            self._reindex_thread(old_thread_id)
+        self._reindex_thread(thread_id)
         self._save_subscriptions()
 
     def get_thread_id(self, handle: str) -> Optional[int]:
@@ -230,7 +427,7 @@ class BlueskyState:
         return sub.thread_id if sub else None
 
     def get_subscription_by_thread(self, thread_id: int) -> Optional[Subscription]:
-        return next((s for s in self.subscriptions if s.thread_id == thread_id), None)
+        return self._by_thread.get(thread_id)
 
     # ------------------------------------------------------------------
     # Intervals
@@ -267,6 +464,19 @@ class BlueskyState:
             if s.next_check_ts and s.next_check_ts <= current_ts
         ]
 
+    def get_feed_head(self, handle: str) -> Optional[str]:
+        sub = self.get_subscription(handle)
+        return sub.feed_head if sub else None
+
+    def set_feed_head(self, handle: str, head: Optional[str]) -> None:
+        """
+        In-memory only: the monitor calls this between checks and persists
+        it with the same tick's update_next_check write.
+        """
+        sub = self.get_subscription(handle)
+        if sub:
+            sub.feed_head = head
+
     def update_next_check(self, handle: str, current_ts: float, default_minutes: int) -> None:
         sub = self.get_subscription(handle)
         if not sub:
@@ -276,16 +486,22 @@ class BlueskyState:
         sub.next_check_ts = current_ts + (minutes * 60)
         self._save_subscriptions()
 
+    def batch_update_next_check(self, updates: Iterable[Tuple[str, float, int]]) -> None:
+        """update_next_check for each (handle, current_ts, default_minutes), one write."""
+        with self.batch():
+            for handle, current_ts, default_minutes in updates:
+                self.update_next_check(handle, current_ts, default_minutes)
+
     # ------------------------------------------------------------------
     # Slug mapping
     # ------------------------------------------------------------------
 
     def set_slug(self, handle: str, slug: str) -> None:
-        self.slug_map[handle.lower()] = slug
+        self.slug_map[sys.intern(_norm_handle(handle))] = slug
         self._save_subscriptions()
 
     def remove_slug(self, handle: str) -> bool:
-        handle = handle.lower()
+        handle = _norm_handle(handle)
         if handle in self.slug_map:
             del self.slug_map[handle]
             self._save_subscriptions()
@@ -1,20 +1,40 @@
 # bot.py
 from __future__ import annotations
 import os
+import atexit
 import asyncio
 import logging
+import logging.handlers
+import queue
+import sys
 import traceback
 import discord
 from discord.ext import commands
 from config import TOKEN  # single source of truth
 
+try:
+    import uvloop  # libuv event loop; not available on Windows
+except ImportError:
+    uvloop = None
+
 # =========================
 # LOGGING SETUP
 # =========================
+# Records are enqueued on the event loop thread and written to stderr by a
+# QueueListener thread, so a burst of errors never blocks the loop on writes.
+_log_stream = logging.StreamHandler()
+_log_stream.setFormatter(logging.Formatter(
+    '[%(asctime)s] [%(levelname)s] %(message)s',
+    datefmt='%H:%M:%S'
+))
+_log_queue: queue.Queue = queue.Queue(-1)
+_log_listener = logging.handlers.QueueListener(_log_queue, _log_stream)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
 logging.basicConfig(
     level=logging.INFO,
-    format='[%(asctime)s] [%(levelname)s] %(message)s',
-    datefmt='%H:%M:%S'
+    handlers=[logging.handlers.QueueHandler(_log_queue)],
 )
 logger = logging.getLogger("jarvis")
 
@@ -142,46 +162,29 @@ async def on_ready():
 @bot.event
 async def on_error(event: str, *args, **kwargs):
     """Catch all unhandled errors in events"""
-    logger.error(f"❌ ERROR in event '{event}':")
-    logger.error(traceback.format_exc())
-    print(f"\n❌ ERROR in event '{event}':")
-    print(traceback.format_exc())
+    tb = traceback.format_exc()
+    msg = f"❌ ERROR in event '{event}':"
+    logger.error(f"{msg}\n{tb}")
+    sys.stderr.write(f"\n{msg}\n{tb}\n")
 
 @bot.event
 async def on_command_error(ctx, error):
     """Catch prefix command errors"""
-    logger.error(f"❌ COMMAND ERROR: {error}")
-    logger.error(traceback.format_exc())
-    print(f"\n❌ COMMAND ERROR: {error}")
-    print(traceback.format_exc())
+    tb = traceback.format_exc()
+    msg = f"❌ COMMAND ERROR: {error}"
+    logger.error(f"{msg}\n{tb}")
+    sys.stderr.write(f"\n{msg}\n{tb}\n")
 
-@bot.tree.error
-async def on_app_command_error(interaction: discord.Interaction, error: discord.app_commands.AppCommandError):
-    """Catch slash command errors - MOST IMPORTANT"""
-    cmd_name = interaction.command.name if interaction.command else "unknown"
-    
-    logger.error("=" * 60)
-    logger.error(f"❌ SLASH COMMAND ERROR: /{cmd_name}")
-    logger.error(f"   User: {interaction.user} ({interaction.user.id})")
-    logger.error(f"   Guild: {interaction.guild}")
-    logger.error(f"   Channel: {interaction.channel}")
-    logger.error(f"   Error Type: {type(error).__name__}")
-    logger.error(f"   Error: {error}")
-    logger.error("   Full Traceback:")
-    logger.error(traceback.format_exc())
-    logger.error("=" * 60)
-    
-    # Also print to console for immediate visibility
-    print("\n" + "=" * 60)
-    print(f"❌ SLASH COMMAND ERROR: /{cmd_name}")
-    print(f"   User: {interaction.user}")
-    print(f"   Error: {error}")
-    print(f"   Full Traceback:")
-    print(traceback.format_exc())
-    print("=" * 60 + "\n")
-    
-    # Try to respond to user
-    error_msg = f"❌ Command failed: {type(error).__name__}"
+# Strong refs for fire-and-forget tasks so they aren't collected mid-flight
+_pending_tasks: set[asyncio.Task] = set()
+
+def _spawn(coro) -> None:
+    task = asyncio.create_task(coro)
+    _pending_tasks.add(task)
+    task.add_done_callback(_pending_tasks.discard)
+
+async def _safe_notify(interaction: discord.Interaction, error_msg: str):
+    """Best-effort error reply to the user"""
     try:
         if interaction.response.is_done():
             await interaction.followup.send(error_msg, ephemeral=True)
@@ -190,6 +193,43 @@ async def on_app_command_error(interaction: discord.Interaction, error: discord.
     except Exception as e:
         logger.error(f"   Could not send error to user: {e}")
 
+@bot.tree.error
+async def on_app_command_error(interaction: discord.Interaction, error: discord.app_commands.AppCommandError):
+    """Catch slash command errors - MOST IMPORTANT"""
+    cmd_name = interaction.command.name if interaction.command else "unknown"
+    tb = traceback.format_exc()
+    
+    # One record for the log...
+    logger.error("\n".join([
+        "=" * 60,
+        f"❌ SLASH COMMAND ERROR: /{cmd_name}",
+        f"   User: {interaction.user} ({interaction.user.id})",
+        f"   Guild: {interaction.guild}",
+        f"   Channel: {interaction.channel}",
+        f"   Error Type: {type(error).__name__}",
+        f"   Error: {error}",
+        "   Full Traceback:",
+        tb,
+        "=" * 60,
+    ]))
+    
+    # ...and one write to the console for immediate visibility
+    sys.stderr.write("\n".join([
+        "",
+        "=" * 60,
+        f"❌ SLASH COMMAND ERROR: /{cmd_name}",
+        f"   User: {interaction.user}",
+        f"   Error: {error}",
+        "   Full Traceback:",
+        tb,
+        "=" * 60,
+        "",
+        "",
+    ]))
+    
+    # Try to respond to user without holding the handler on the round trip
+    _spawn(_safe_notify(interaction, f"❌ Command failed: {type(error).__name__}"))
+
 @bot.event
 async def on_disconnect():
     """Log when bot disconnects"""
@@ -210,23 +250,26 @@ async def main():
         raise RuntimeError("DISCORD_TOKEN is not set in environment or config.py")
     
     async with bot:
-        await load_cogs(bot)
-        await setup_daily_games(bot)
+        # Independent: load_cogs skips games_daily, which setup_daily_games owns
+        await asyncio.gather(load_cogs(bot), setup_daily_games(bot))
         
         try:
             await bot.start(TOKEN)
         except Exception as e:
-            logger.critical(f"❌ FATAL ERROR: Bot crashed!")
-            logger.critical(traceback.format_exc())
-            print("\n❌ FATAL ERROR: Bot crashed!")
-            print(traceback.format_exc())
+            tb = traceback.format_exc()
+            logger.critical(f"❌ FATAL ERROR: Bot crashed!\n{tb}")
+            sys.stderr.write(f"\n❌ FATAL ERROR: Bot crashed!\n{tb}\n")
+            sys.stderr.flush()
             raise
 
 if __name__ == "__main__":
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
         print("\n👋 Shutting down JARVIS...")
     except Exception as e:
-        print(f"\n❌ FATAL: {e}")
-        print(traceback.format_exc())
+        sys.stderr.write(f"\n❌ FATAL: {e}\n{traceback.format_exc()}\n")
+        sys.stderr.flush()
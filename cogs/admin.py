@@ -1,7 +1,9 @@
 
 from __future__ import annotations
 
+import os
 import sys
+import asyncio
 import platform
 from pathlib import Path
 from typing import Optional
@@ -10,24 +12,38 @@ import discord
 from discord import app_commands
 from discord.ext import commands
 
-from config import DEV_GUILD_ID, DISCORD_OWNER_ID
+from config import DEV_GUILD_ID, DISCORD_OWNER_ID, MAX_DISCORD_FILE_SIZE_BYTES
 
 # Project root: .../JARVIS
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 LOGS_DIR = PROJECT_ROOT / "logs"
+LOGS_DIR_RESOLVED = LOGS_DIR.resolve()
+LOGS_DIR_PREFIX = str(LOGS_DIR_RESOLVED) + os.sep
+
+# Discord's per-message content limit
+MESSAGE_LIMIT = 2000
+
+# Immutable snowflake for the dev guild, shared by the sync commands
+DEV_GUILD_OBJ = discord.Object(id=DEV_GUILD_ID)
 
 
 # ------------------------------------------------------------
 # Owner check
 # ------------------------------------------------------------
 def _is_owner(interaction: discord.Interaction) -> bool:
-    return bool(interaction.user and interaction.user.id == DISCORD_OWNER_ID)
+    # Slash command interactions always carry a user
+    return interaction.user.id == DISCORD_OWNER_ID
 
 
 def owner_only():
     return app_commands.check(_is_owner)
 
 
+def _ext_name(cog: str) -> str:
+    """'bluesky_commands' or 'cogs.bluesky_commands' -> 'cogs.bluesky_commands'"""
+    return cog if cog.startswith("cogs.") else "cogs." + cog
+
+
 # ============================================================
 #                         ADMIN COG
 # ============================================================
@@ -57,6 +73,13 @@ class Admin(commands.Cog):
 
     def __init__(self, bot: commands.Bot):
         self.bot = bot
+        # Fixed for a given token; fetched once on first use
+        self._app_id: Optional[int] = None
+        # Health-check fields that can't change while the process runs
+        self._static_fields = [
+            ("Python", platform.python_version()),
+            ("discord.py", discord.__version__),
+        ]
 
     # --------------------------------------------------------
     # Error handling
@@ -95,7 +118,7 @@ class Admin(commands.Cog):
     async def sync_guild(self, interaction: discord.Interaction) -> None:
         await interaction.response.defer(ephemeral=True, thinking=True)
 
-        guild = interaction.guild or discord.Object(id=DEV_GUILD_ID)
+        guild = interaction.guild or DEV_GUILD_OBJ
         synced = await self.bot.tree.sync(guild=guild)
 
         await interaction.followup.send(
@@ -133,7 +156,7 @@ class Admin(commands.Cog):
     async def reload_cog(self, interaction: discord.Interaction, cog: str) -> None:
         await interaction.response.defer(ephemeral=True, thinking=True)
 
-        ext = cog if cog.startswith("cogs.") else f"cogs.{cog}"
+        ext = _ext_name(cog)
         try:
             await self.bot.reload_extension(ext)
         except commands.ExtensionNotLoaded:
@@ -161,16 +184,27 @@ class Admin(commands.Cog):
     async def reload_all(self, interaction: discord.Interaction) -> None:
         await interaction.response.defer(ephemeral=True, thinking=True)
 
-        results = []
-        for ext in list(self.bot.extensions.keys()):
-            try:
-                await self.bot.reload_extension(ext)
-                results.append(f"✅ {ext}")
-            except Exception as e:
-                results.append(f"❌ {ext} â†’ {e}")
+        # Reload concurrently; cog setups that await (HTTP, warmup) overlap
+        exts = list(self.bot.extensions.keys())
+        outcomes = await asyncio.gather(
+            *(self.bot.reload_extension(ext) for ext in exts),
+            return_exceptions=True,
+        )
 
-        msg = "**Reloaded cogs:**\n" + "\n".join(results)
-        await interaction.followup.send(msg, ephemeral=True)
+        results = [
+            f"❌ {ext} â†’ {outcome}" if isinstance(outcome, BaseException) else f"✅ {ext}"
+            for ext, outcome in zip(exts, outcomes)
+        ]
+
+        # Split across followups so long failure lists stay under Discord's limit
+        chunk = "**Reloaded cogs:**"
+        for line in results:
+            if len(chunk) + 1 + len(line) > MESSAGE_LIMIT:
+                await interaction.followup.send(chunk, ephemeral=True)
+                chunk = line
+            else:
+                chunk += "\n" + line
+        await interaction.followup.send(chunk, ephemeral=True)
 
     # --------------------------------------------------------
     # /admin load
@@ -183,7 +217,7 @@ class Admin(commands.Cog):
     async def load_cog(self, interaction: discord.Interaction, cog: str) -> None:
         await interaction.response.defer(ephemeral=True, thinking=True)
 
-        ext = cog if cog.startswith("cogs.") else f"cogs.{cog}"
+        ext = _ext_name(cog)
         try:
             await self.bot.load_extension(ext)
         except Exception as e:
@@ -205,7 +239,7 @@ class Admin(commands.Cog):
     async def unload_cog(self, interaction: discord.Interaction, cog: str) -> None:
         await interaction.response.defer(ephemeral=True, thinking=True)
 
-        ext = cog if cog.startswith("cogs.") else f"cogs.{cog}"
+        ext = _ext_name(cog)
         try:
             await self.bot.unload_extension(ext)
         except Exception as e:
@@ -263,11 +297,13 @@ class Admin(commands.Cog):
             )
             return
 
+        # Ack before any REST call so a slow API can't miss the 3s window
         await interaction.response.defer(ephemeral=True, thinking=True)
 
-        # Get application info
-        app_info = await self.bot.application_info()
-        app_id = app_info.id
+        # Get application info (cached after the first nuke)
+        if self._app_id is None:
+            self._app_id = (await self.bot.application_info()).id
+        app_id = self._app_id
 
         # -------------------------------------------
         # 1) WIPE GLOBAL COMMANDS (correct HTTP method)
@@ -284,8 +320,7 @@ class Admin(commands.Cog):
         # 2) Immediately restore dev guild commands
         # -------------------------------------------
         try:
-            guild_obj = discord.Object(id=DEV_GUILD_ID)
-            synced = await self.bot.tree.sync(guild=guild_obj)
+            synced = await self.bot.tree.sync(guild=DEV_GUILD_OBJ)
         except Exception as e:
             return await interaction.followup.send(
                 f"☢ Global commands nuked, but dev guild sync failed: `{e}`.\n"
@@ -312,15 +347,19 @@ class Admin(commands.Cog):
         await interaction.response.defer(ephemeral=True, thinking=True)
 
         LOGS_DIR.mkdir(parents=True, exist_ok=True)
-        files = [p for p in LOGS_DIR.iterdir() if p.is_file()]
 
-        if not files:
+        # One directory pass; DirEntry caches is_file()/stat()
+        with os.scandir(LOGS_DIR) as it:
+            entries = sorted((e.name, e.stat().st_size) for e in it if e.is_file())
+
+        if not entries:
             return await interaction.followup.send("No log files found.", ephemeral=True)
 
-        lines = []
-        for p in sorted(files):
-            size_kb = p.stat().st_size / 1024
-            lines.append(f"â€¢ `{p.name}` â€” {size_kb:.1f} KB")
+        # Tenths of a KB in integer math (rounded), formatted without floats
+        lines = [
+            f"â€¢ `{name}` â€” {kb10 // 10}.{kb10 % 10} KB"
+            for name, kb10 in ((n, (sz * 10 + 512) >> 10) for n, sz in entries)
+        ]
 
         await interaction.followup.send("\n".join(lines), ephemeral=True)
 
@@ -335,11 +374,19 @@ class Admin(commands.Cog):
     async def logs_get(self, interaction: discord.Interaction, filename: str) -> None:
         await interaction.response.defer(ephemeral=True, thinking=True)
 
+        # Plain file names only; rejects separators and ./.. up front
+        if "/" in filename or "\\" in filename or filename.startswith("."):
+            return await interaction.followup.send(
+                "❌ Invalid filename.",
+                ephemeral=True,
+            )
+
         LOGS_DIR.mkdir(parents=True, exist_ok=True)
-        path = (LOGS_DIR / filename).resolve()
+        path = (LOGS_DIR_RESOLVED / filename).resolve()
 
-        # Prevent directory traversal attacks
-        if LOGS_DIR.resolve() not in path.parents and path.parent != LOGS_DIR.resolve():
+        # Prevent directory traversal attacks (both paths are resolved, so a
+        # prefix check on the strings is exact)
+        if not str(path).startswith(LOGS_DIR_PREFIX):
             return await interaction.followup.send(
                 "❌ Invalid filename.",
                 ephemeral=True,
@@ -351,11 +398,26 @@ class Admin(commands.Cog):
                 ephemeral=True,
             )
 
-        await interaction.followup.send(
-            content=f"🔄„ Log file `{filename}`:",
-            file=discord.File(str(path), filename=path.name),
-            ephemeral=True,
-        )
+        size = path.stat().st_size
+        if size > MAX_DISCORD_FILE_SIZE_BYTES:
+            return await interaction.followup.send(
+                f"❌ Log file `{filename}` is too large to upload ({size / 1024 / 1024:.1f} MB).",
+                ephemeral=True,
+            )
+
+        # Open off the loop; discord.py streams from the handle but doesn't own it
+        fh = await asyncio.to_thread(open, path, "rb")
+        file = discord.File(fh, filename=path.name)
+        try:
+            await interaction.followup.send(
+                content=f"🔄„ Log file `{filename}`:",
+                file=file,
+                ephemeral=True,
+            )
+        finally:
+            # File stubs out fh.close until File.close() restores it
+            file.close()
+            fh.close()
 
     # --------------------------------------------------------
     # /admin check
@@ -371,6 +433,7 @@ class Admin(commands.Cog):
         latency = round(self.bot.latency * 1000, 1)  # ms
         guild_count = len(self.bot.guilds)
         cog_count = len(self.bot.cogs)
+        # Global slash commands and context menus, as on_ready reports
         cmd_count = len(self.bot.tree.get_commands())
 
         embed = discord.Embed(
@@ -382,8 +445,8 @@ class Admin(commands.Cog):
         embed.add_field(name="Guilds", value=str(guild_count))
         embed.add_field(name="Cogs", value=str(cog_count))
         embed.add_field(name="Slash Commands", value=str(cmd_count))
-        embed.add_field(name="Python", value=platform.python_version())
-        embed.add_field(name="discord.py", value=discord.__version__)
+        for name, value in self._static_fields:
+            embed.add_field(name=name, value=value)
 
         await interaction.followup.send(embed=embed, ephemeral=True)
 
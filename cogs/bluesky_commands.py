@@ -6,19 +6,45 @@ import discord
 from discord.ext import commands
 from discord import app_commands
 import asyncio
-from typing import List
-
-from config import DEV_GUILD_ID, DISCORD_OWNER_ID
+import bisect
+import logging
+import os
+import time
+from itertools import islice
+from typing import List, Tuple
+
+from config import DEV_GUILD_ID, DISCORD_OWNER_ID, MEDIA_ROOT
 from utils.bluesky.api import BlueskyAPI
+from utils.bluesky.feed import is_non_reply
+from utils.bluesky.post_handler import PostHandler, send_item_to_channel
 from utils.bluesky.state import get_shared_state
 
+logger = logging.getLogger(__name__)
+
 DEFAULT_INTERVAL_MINUTES = 5
 
+# Media folder listing for slug autocomplete, refreshed at most this often
+SLUG_CACHE_TTL = 5.0
+_slug_cache: Tuple[float, List[Tuple[str, str]]] = (float("-inf"), [])
+
 
 def _normalize_handle(handle: str) -> str:
     return handle.lstrip("@").lower()
 
 
+def _scan_slugs(root) -> List[Tuple[str, str]]:
+    """Sorted (slug, casefolded slug) pairs for media folders under root."""
+    try:
+        with os.scandir(root) as it:
+            names = [
+                e.name for e in it
+                if e.is_dir() and not e.name.startswith("_") and e.name != "events"
+            ]
+    except FileNotFoundError:
+        return []
+    return [(n, n.casefold()) for n in sorted(names)]
+
+
 class BlueskyCommands(commands.Cog):
     """
     Slash commands for managing Bluesky subscriptions.
@@ -29,6 +55,10 @@ class BlueskyCommands(commands.Cog):
         self.api = BlueskyAPI()
         self.state = get_shared_state()
 
+    async def cog_unload(self):
+        # The API keeps one pooled session for the cog's lifetime
+        await self.api.close()
+
     # ============================================================
     # COMMAND GROUP
     # ============================================================
@@ -43,9 +73,21 @@ class BlueskyCommands(commands.Cog):
         current: str,
     ) -> List[app_commands.Choice[str]]:
         """Autocomplete for subscribed handles"""
-        handles = self.state.list_handles()
-        current_lower = current.lower()
-        matches = [h for h in handles if current_lower in h.lower()][:25]
+        current_lower = current.casefold()
+        
+        # Prefix matches first, found by bisect on the sorted handle list
+        lowers, originals = self.state.handles_sorted()
+        lo = bisect.bisect_left(lowers, current_lower)
+        hi = bisect.bisect_left(lowers, current_lower + "\uffff", lo)
+        matches = originals[lo:min(hi, lo + 25)]
+        
+        # Top up with handles that contain the input further in
+        if len(matches) < 25 and current_lower:
+            matches += islice(
+                (h for h, low in self.state.handles_lower()
+                 if current_lower in low and not low.startswith(current_lower)),
+                25 - len(matches),
+            )
         return [app_commands.Choice(name=h, value=h) for h in matches]
 
     async def slug_autocomplete(
@@ -54,27 +96,56 @@ class BlueskyCommands(commands.Cog):
         current: str,
     ) -> List[app_commands.Choice[str]]:
         """Autocomplete for media folder slugs."""
-        from config import MEDIA_ROOT
-        from pathlib import Path
-        
-        # Get all directories in MEDIA_ROOT (excluding special folders)
-        media_root = Path(MEDIA_ROOT)
-        slugs = []
+        global _slug_cache
         
-        if media_root.exists():
-            for item in sorted(media_root.iterdir()):
-                if item.is_dir() and not item.name.startswith("_") and not item.name == "events":
-                    slugs.append(item.name)
+        # Get all directories in MEDIA_ROOT (excluding special folders);
+        # rescanned off the event loop at most once per SLUG_CACHE_TTL
+        scanned_at, slugs = _slug_cache
+        now = time.monotonic()
+        if now - scanned_at >= SLUG_CACHE_TTL:
+            slugs = await asyncio.to_thread(_scan_slugs, MEDIA_ROOT)
+            _slug_cache = (now, slugs)
         
-        # Filter by current input
-        current_lower = current.lower()
-        filtered = [s for s in slugs if current_lower in s.lower()]
+        # Filter by current input; slugs are already sorted, so stop
+        # after the first 25 matches
+        current_lower = current.casefold()
+        filtered = islice((s for s, low in slugs if current_lower in low), 25)
         
         return [
             app_commands.Choice(name=s, value=s)
-            for s in filtered[:25]
+            for s in filtered
         ]
 
+    # ============================================================
+    # Shared: post newest non-reply after subscribing
+    # ============================================================
+    async def _post_latest_non_reply(
+        self,
+        target: discord.abc.Messageable,
+        did: str,
+        normalized: str,
+    ) -> None:
+        """Best-effort: post the handle's newest non-reply into target."""
+        try:
+            response = await self.api.get_author_feed(did, limit=100)
+            
+            # Check if response is valid BEFORE using .get()
+            if not isinstance(response, dict):
+                logger.warning("[BSKY] API error for @%s: %s", normalized, response)
+            elif "feed" in response:
+                # FIX: Use full feed items, not just posts
+                feed_items = response.get("feed", [])
+                # First non-reply; stops at the first match
+                latest_item = next(filter(is_non_reply, feed_items), None)
+                
+                if latest_item is not None:
+                    # Use post_handler to properly handle media
+                    await send_item_to_channel(target, self.api, latest_item)
+                else:
+                    await target.send(f"✅ Now following `@{normalized}`, but no recent non-reply posts found in last 100 posts.")
+        except Exception:
+            logger.exception("[BSKY] Could not fetch latest for @%s", normalized)
+
     # ============================================================
     # /bsky add
     # ============================================================
@@ -128,54 +199,30 @@ class BlueskyCommands(commands.Cog):
             # Tag the user who created it
             await thread.send(f"{interaction.user.mention} created this subscription")
             
-            # Save guild and parent channel info (needed to find threads later!)
-            if not self.state.guild_id:
-                self.state.guild_id = interaction.guild.id
-            if not self.state.parent_channel_id:
-                self.state.parent_channel_id = interaction.channel.id
-            self.state._save_subscriptions()
-            
-            # Add subscription (or update existing one to this thread)
-            existing = self.state.get_subscription(normalized)
-            if existing:
-                # Handle already followed - update to this thread
-                self.state.set_thread_id(normalized, thread.id)
-            else:
-                # New subscription
-                self.state.add_subscription(
-                    handle=normalized,
-                    thread_id=thread.id,
-                    interval_minutes=DEFAULT_INTERVAL_MINUTES,
-                )
-            
-			# Fetch and post latest
-            try:
-                response = await self.api.get_author_feed(did, limit=100)
+            # One off-loop subscriptions write for the guild info + subscription change
+            async with self.state.batch_async():
+                # Save guild and parent channel info (needed to find threads later!)
+                if not self.state.guild_id:
+                    self.state.guild_id = interaction.guild.id
+                if not self.state.parent_channel_id:
+                    self.state.parent_channel_id = interaction.channel.id
+                self.state._save_subscriptions()
                 
-                # Check if response is valid BEFORE using .get()
-                if not isinstance(response, dict):
-                    print(f"[BSKY] API error for @{normalized}: {response}")
-                elif "feed" in response:
-                    # FIX: Use full feed items, not just posts
-                    feed_items = response.get("feed", [])
-                    # Filter to non-replies
-                    non_reply_items = [
-                        item for item in feed_items
-                        if "reply" not in item.get("post", {}).get("record", {})
-                    ]
-                    
-                    if non_reply_items:
-                        latest_item = non_reply_items[0]
-                        # Use post_handler to properly handle media
-                        from utils.bluesky.post_handler import send_item_to_channel
-                        await send_item_to_channel(thread, self.api, latest_item)
-                    else:
-                        await thread.send(f"✅ Now following `@{normalized}`, but no recent non-reply posts found in last 100 posts.")
-            except Exception as e:
-                import traceback
-                print(f"[BSKY] Could not fetch latest for @{normalized}: {e}")
-                print(f"[BSKY] Full traceback:")
-                traceback.print_exc()
+                # Add subscription (or update existing one to this thread)
+                existing = self.state.get_subscription(normalized)
+                if existing:
+                    # Handle already followed - update to this thread
+                    self.state.set_thread_id(normalized, thread.id)
+                else:
+                    # New subscription
+                    self.state.add_subscription(
+                        handle=normalized,
+                        thread_id=thread.id,
+                        interval_minutes=DEFAULT_INTERVAL_MINUTES,
+                    )
+            
+            # Fetch and post latest
+            await self._post_latest_non_reply(thread, did, normalized)
             
             await interaction.followup.send(
                 f":white_check_mark: Created thread and following `@{normalized}`",
@@ -184,54 +231,30 @@ class BlueskyCommands(commands.Cog):
         
         # CASE 2: Run in a THREAD - add to existing thread
         elif isinstance(interaction.channel, discord.Thread):
-            # Save guild and parent channel info (needed to find threads later!)
-            if not self.state.guild_id:
-                self.state.guild_id = interaction.guild.id
-            if not self.state.parent_channel_id:
-                self.state.parent_channel_id = interaction.channel.parent_id
-            self.state._save_subscriptions()
-            
-            # Add subscription (or update existing one to this thread)
-            existing = self.state.get_subscription(normalized)
-            if existing:
-                # Handle already followed - update to this thread
-                self.state.set_thread_id(normalized, interaction.channel.id)
-            else:
-                # New subscription
-                self.state.add_subscription(
-                    handle=normalized,
-                    thread_id=interaction.channel.id,
-                    interval_minutes=DEFAULT_INTERVAL_MINUTES,
-                )
-            
-			# Fetch and post latest
-            try:
-                response = await self.api.get_author_feed(did, limit=100)
+            # One off-loop subscriptions write for the guild info + subscription change
+            async with self.state.batch_async():
+                # Save guild and parent channel info (needed to find threads later!)
+                if not self.state.guild_id:
+                    self.state.guild_id = interaction.guild.id
+                if not self.state.parent_channel_id:
+                    self.state.parent_channel_id = interaction.channel.parent_id
+                self.state._save_subscriptions()
                 
-                # Check if response is valid BEFORE using .get()
-                if not isinstance(response, dict):
-                    print(f"[BSKY] API error for @{normalized}: {response}")
-                elif "feed" in response:
-                    # FIX: Use full feed items, not just posts
-                    feed_items = response.get("feed", [])
-                    # Filter to non-replies
-                    non_reply_items = [
-                        item for item in feed_items
-                        if "reply" not in item.get("post", {}).get("record", {})
-                    ]
-                    
-                    if non_reply_items:
-                        latest_item = non_reply_items[0]
-                        # Use post_handler to properly handle media
-                        from utils.bluesky.post_handler import send_item_to_channel
-                        await send_item_to_channel(interaction.channel, self.api, latest_item)
-                    else:
-                        await interaction.channel.send(f"✅ Now following `@{normalized}`, but no recent non-reply posts found in last 100 posts.")
-            except Exception as e:
-                import traceback
-                print(f"[BSKY] Could not fetch latest for @{normalized}: {e}")
-                print(f"[BSKY] Full traceback:")
-                traceback.print_exc()
+                # Add subscription (or update existing one to this thread)
+                existing = self.state.get_subscription(normalized)
+                if existing:
+                    # Handle already followed - update to this thread
+                    self.state.set_thread_id(normalized, interaction.channel.id)
+                else:
+                    # New subscription
+                    self.state.add_subscription(
+                        handle=normalized,
+                        thread_id=interaction.channel.id,
+                        interval_minutes=DEFAULT_INTERVAL_MINUTES,
+                    )
+            
+            # Fetch and post latest
+            await self._post_latest_non_reply(interaction.channel, did, normalized)
             
             await interaction.followup.send(
                 f":white_check_mark: Now following `@{normalized}` in this thread",
@@ -273,7 +296,8 @@ class BlueskyCommands(commands.Cog):
             )
             return
 
-        self.state.remove_subscription(normalized)
+        async with self.state.batch_async():
+            self.state.remove_subscription(normalized)
 
         await interaction.response.send_message(
             f":wastebasket: Unfollowed `@{normalized}`.",
@@ -286,9 +310,9 @@ class BlueskyCommands(commands.Cog):
     @bsky.command(name="list", description="List all followed Bluesky handles")
     async def list_handles(self, interaction: discord.Interaction):
         """Show all active Bluesky subscriptions."""
-        handles = self.state.list_handles()
+        subs = self.state.subscriptions
         
-        if not handles:
+        if not subs:
             await interaction.response.send_message(
                 ":information_source: No Bluesky handles are currently being followed.",
                 ephemeral=True,
@@ -300,27 +324,23 @@ class BlueskyCommands(commands.Cog):
             color=discord.Color.blue(),
         )
         
-        for handle in handles:
-            sub = self.state.get_subscription(handle)
-            if sub:
-                # Try to get the actual thread
+        # Subscriptions carry their own fields; no per-handle lookup needed.
+        # get_channel is a cache read that returns None rather than raising.
+        get_channel = self.bot.get_channel
+        for sub in subs:
+            if not sub.thread_id:
                 thread_info = "No thread"
-                if sub.thread_id:
-                    try:
-                        thread = self.bot.get_channel(sub.thread_id)
-                        if thread:
-                            thread_info = f"<#{sub.thread_id}>"
-                        else:
-                            thread_info = f"Thread {sub.thread_id} (not found)"
-                    except:
-                        thread_info = f"Thread {sub.thread_id} (not accessible)"
-                
-                interval = sub.interval_minutes or DEFAULT_INTERVAL_MINUTES
-                embed.add_field(
-                    name=f"@{handle}",
-                    value=f"{thread_info} | Every {interval}min",
-                    inline=False,
-                )
+            elif get_channel(sub.thread_id):
+                thread_info = f"<#{sub.thread_id}>"
+            else:
+                thread_info = f"Thread {sub.thread_id} (not found)"
+            
+            interval = sub.interval_minutes or DEFAULT_INTERVAL_MINUTES
+            embed.add_field(
+                name=f"@{sub.handle}",
+                value=f"{thread_info} | Every {interval}min",
+                inline=False,
+            )
         
         await interaction.response.send_message(embed=embed, ephemeral=True)
 
@@ -357,8 +377,7 @@ class BlueskyCommands(commands.Cog):
         await interaction.response.defer(ephemeral=False)
         
         try:
-            did = await self.api.resolve_handle(normalized)
-            response = await self.api.get_author_feed(did, limit=100)
+            response = await self.api.get_feed_by_handle(normalized, limit=100)
             
             # Check if response is valid
             if not isinstance(response, dict):
@@ -377,30 +396,25 @@ class BlueskyCommands(commands.Cog):
             # Get feed items (not just posts)
             feed_items = response.get("feed", [])
             
-            # Filter out replies
-            non_reply_items = [
-                item for item in feed_items
-                if "reply" not in item.get("post", {}).get("record", {})
-            ]
+            # First non-reply; stops at the first match
+            latest_item = next(filter(is_non_reply, feed_items), None)
             
-            if not non_reply_items:
+            if latest_item is None:
                 await interaction.followup.send(
                     f":warning: No recent non-reply posts found for `@{normalized}` (checked last 100 posts)."
                 )
                 return
             
-            latest_item = non_reply_items[0]
             post = latest_item.get("post") or {}
             
             # Debug: Check what we found
-            print(f"[BSKY_LATEST] Found post: {post.get('uri')}")
-            print(f"[BSKY_LATEST] Has reason (repost): {bool(latest_item.get('reason'))}")
-            print(f"[BSKY_LATEST] Has reply: {bool(post.get('record', {}).get('reply'))}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("[BSKY_LATEST] Found post: %s", post.get("uri"))
+                logger.debug("[BSKY_LATEST] Has reason (repost): %s", bool(latest_item.get("reason")))
+                logger.debug("[BSKY_LATEST] Has reply: %s", bool(post.get("record", {}).get("reply")))
             
             # For /bsky latest, post directly without watermark check
             # Use send_item_to_channel but temporarily bypass watermark
-            from utils.bluesky.post_handler import PostHandler
-            
             try:
                 handler = PostHandler(bot=self.bot, api=self.api)
                 
@@ -419,12 +433,10 @@ class BlueskyCommands(commands.Cog):
                 if original_watermark:
                     handler.state.set_last_seen_uri(handle_from_post, original_watermark)
                 
-                print(f"[BSKY_LATEST] Successfully posted")
+                logger.debug("[BSKY_LATEST] Successfully posted")
                 
             except Exception as e:
-                print(f"[BSKY_LATEST] Error posting: {e}")
-                import traceback
-                traceback.print_exc()
+                logger.exception("[BSKY_LATEST] Error posting for @%s", normalized)
                 
                 # Restore watermark on error too
                 if original_watermark:
@@ -492,7 +504,8 @@ class BlueskyCommands(commands.Cog):
             )
             return
 
-        self.state.set_interval(normalized, minutes)
+        async with self.state.batch_async():
+            self.state.set_interval(normalized, minutes)
 
         await interaction.response.send_message(
             f":timer: Polling interval for `@{normalized}` set to {minutes} minutes.",
@@ -597,7 +610,9 @@ class BlueskyCommands(commands.Cog):
         
         # Remove mapping if no slug provided
         if not slug:
-            if self.state.remove_slug(normalized):
+            async with self.state.batch_async():
+                removed = self.state.remove_slug(normalized)
+            if removed:
                 await interaction.response.send_message(
                     f":white_check_mark: Removed slug mapping for `@{normalized}`",
                     ephemeral=True
@@ -610,7 +625,8 @@ class BlueskyCommands(commands.Cog):
             return
         
         # Set mapping
-        self.state.set_slug(normalized, slug)
+        async with self.state.batch_async():
+            self.state.set_slug(normalized, slug)
         
         await interaction.response.send_message(
             f":white_check_mark: Mapped `@{normalized}` → `{slug}`",
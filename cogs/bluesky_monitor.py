@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 import asyncio
-from typing import List
+import logging
+from typing import Dict, List, Optional, Tuple
 
 import discord
 from discord.ext import commands, tasks
@@ -11,12 +12,36 @@ from discord.ext import commands, tasks
 from config import DEV_GUILD_ID
 from utils.bluesky.state import get_shared_state  # Use singleton getter
 from utils.bluesky.api import BlueskyAPI
+from utils.bluesky.feed import parse_feed
 from utils.bluesky.post_handler import send_item_to_channel
-from utils.bluesky.media import cleanup_bluesky_cache
+from utils.bluesky.media import cleanup_bluesky_cache_async
+
+logger = logging.getLogger(__name__)
 
 
 DEFAULT_INTERVAL_MINUTES = 5
 
+# Due handles are checked concurrently, at most this many at once
+MONITOR_CONCURRENCY = 8
+
+# Feed page sizes: a short page covers the usual handful of new posts; the
+# wide page is used when the watermark falls off the short one
+FEED_LIMIT = 25
+FEED_LIMIT_WIDE = 100  # handles reply-heavy accounts
+# Handles whose short page missed the watermark this many checks in a row
+# start with the wide one, until a check finds it within the short range
+WIDEN_STICKY_AFTER = 3
+
+
+def _feed_head(item: dict) -> str:
+    """
+    Signature of a feed entry: its post URI plus the time it entered the
+    feed (a repost's own indexedAt, else the post's).
+    """
+    post = item.get("post") or {}
+    reason = item.get("reason") or {}
+    return f"{post.get('uri')}|{reason.get('indexedAt') or post.get('indexedAt')}"
+
 
 class BlueskyMonitor(commands.Cog):
     """Background task that checks Bluesky feeds at individual intervals."""
@@ -25,6 +50,18 @@ class BlueskyMonitor(commands.Cog):
         self.bot = bot
         self.api = BlueskyAPI()
         self.state = get_shared_state()  # FIXED: Use singleton instead of creating new instance
+        self._sem = asyncio.Semaphore(MONITOR_CONCURRENCY)
+        # Resolved once the bot is ready; re-resolved if the configured guild changes
+        self._guild: Optional[discord.Guild] = None
+        # thread_id -> thread fetched over HTTP because the gateway cache
+        # hadn't seen it. Such objects don't receive THREAD_UPDATEs, so they
+        # are only used until bot.get_channel() can return the live one.
+        self._fetched_threads: Dict[int, discord.Thread] = {}
+        # handle -> consecutive checks where the short page missed the watermark
+        self._widen_counts: Dict[str, int] = {}
+        # thread_id -> unarchive edit issued this tick; handles sharing a
+        # thread await the same edit instead of each sending one
+        self._unarchive_tasks: Dict[int, asyncio.Task] = {}
         self._monitor_loop.start()
         self._cache_cleanup_loop.start()
 
@@ -35,22 +72,27 @@ class BlueskyMonitor(commands.Cog):
     async def _monitor_loop(self):
         """Each subscribed handle is checked when its own interval expires."""
         now_ts = discord.utils.utcnow().timestamp()
+        self._unarchive_tasks.clear()
 
         due_subs = self.state.get_due_subscriptions(now_ts)
         if not due_subs:
             return
 
-        for sub in due_subs:
-            try:
-                await self._check_subscription(sub)
-            except Exception as e:
-                print(f"[BSKY_MONITOR] Error checking @{sub.handle}: {e}")
-            finally:
-                # Always update next check time
-                self.state.update_next_check(
-                    sub.handle,
-                    now_ts,
-                    DEFAULT_INTERVAL_MINUTES,
+        async def _guarded(sub):
+            async with self._sem:
+                try:
+                    await self._check_subscription(sub)
+                except Exception:
+                    logger.exception("[BSKY_MONITOR] Error checking @%s", sub.handle)
+
+        try:
+            # Fetches are network-bound; overlap them instead of awaiting in turn
+            await asyncio.gather(*(_guarded(sub) for sub in due_subs))
+        finally:
+            # Always update next check times - one off-loop write per tick
+            async with self.state.batch_async():
+                self.state.batch_update_next_check(
+                    (sub.handle, now_ts, DEFAULT_INTERVAL_MINUTES) for sub in due_subs
                 )
 
     # ------------------------------------------------------------
@@ -60,8 +102,47 @@ class BlueskyMonitor(commands.Cog):
     async def before_monitor_loop(self):
         """Runs once before the monitor starts."""
         await self.bot.wait_until_ready()
+        self._get_guild()
         self.state.initialize_intervals(DEFAULT_INTERVAL_MINUTES)
-        print("[BSKY_MONITOR] Interval scheduler initialized.")
+        logger.info("[BSKY_MONITOR] Interval scheduler initialized.")
+
+    # ------------------------------------------------------------
+    # THREAD RESOLUTION
+    # ------------------------------------------------------------
+    def _get_guild(self) -> Optional[discord.Guild]:
+        # guild_id is only recorded by the first /bsky add, so it can change
+        guild_id = self.state.guild_id or DEV_GUILD_ID
+        if self._guild is None or self._guild.id != guild_id:
+            self._guild = self.bot.get_guild(guild_id)
+        return self._guild
+
+    async def _resolve_thread(self, thread_id: int) -> Optional[discord.Thread]:
+        """
+        Look the thread up in discord.py's caches, falling back to the API
+        when they haven't seen it yet (e.g. archived threads after boot).
+        Gateway-cached threads are preferred: their archived flag is live.
+        """
+        thread = self.bot.get_channel(thread_id)
+        if thread is None:
+            guild = self._get_guild()
+            if guild:
+                thread = guild.get_thread(thread_id)
+            else:
+                logger.warning("[BSKY_MONITOR] Guild not found")
+
+        if thread is not None:
+            self._fetched_threads.pop(thread_id, None)
+        else:
+            thread = self._fetched_threads.get(thread_id)
+            if thread is None:
+                try:
+                    thread = await self.bot.fetch_channel(thread_id)
+                except discord.HTTPException:
+                    return None
+                if isinstance(thread, discord.Thread):
+                    self._fetched_threads[thread_id] = thread
+
+        return thread if isinstance(thread, discord.Thread) else None
 
     # ------------------------------------------------------------
     # SEND ITEMS TO THREAD
@@ -72,25 +153,33 @@ class BlueskyMonitor(commands.Cog):
 
         thread_id = self.state.get_thread_id(handle)
         if not thread_id:
-            print(f"[BSKY_MONITOR] No thread mapped for @{handle}")
+            logger.warning("[BSKY_MONITOR] No thread mapped for @%s", handle)
             return
 
-        guild = self.bot.get_guild(self.state.guild_id or DEV_GUILD_ID)
-        if not guild:
-            print(f"[BSKY_MONITOR] Guild not found")
-            return
-
-        thread = guild.get_thread(thread_id)
-        if not isinstance(thread, discord.Thread):
-            print(f"[BSKY_MONITOR] Invalid thread ID for @{handle}")
+        thread = await self._resolve_thread(thread_id)
+        if thread is None:
+            logger.warning("[BSKY_MONITOR] Invalid thread ID for @%s", handle)
             return
 
         # Auto-unarchive
         if thread.archived:
+            task = self._unarchive_tasks.get(thread.id)
+            if task is None:
+                task = asyncio.ensure_future(thread.edit(archived=False))
+                self._unarchive_tasks[thread.id] = task
             try:
-                await thread.edit(archived=False)
+                # shield: one cancelled waiter must not cancel the shared edit
+                thread = await asyncio.shield(task)
+                if thread_id in self._fetched_threads:
+                    # Still not in the gateway cache; keep the fresher copy
+                    self._fetched_threads[thread_id] = thread
+            except discord.NotFound:
+                # Deleted since it was resolved; re-resolve next tick
+                self._fetched_threads.pop(thread_id, None)
+                logger.warning("[BSKY_MONITOR] Thread deleted for @%s, skipping", handle)
+                return
             except Exception as e:
-                print(f"[BSKY_MONITOR] Failed to unarchive thread: {e}")
+                logger.warning("[BSKY_MONITOR] Failed to unarchive thread: %s", e)
 
         # Post in chronological order
         for item in items:
@@ -102,19 +191,20 @@ class BlueskyMonitor(commands.Cog):
                 uri = post.get("uri")
                 
                 if e.code == 40005:  # Payload Too Large
-                    print(f"[BSKY_MONITOR] Skipping large post for @{handle} (413)")
+                    logger.warning("[BSKY_MONITOR] Skipping large post for @%s (413)", handle)
                 elif e.code == 10003:  # Unknown Channel
-                    print(f"[BSKY_MONITOR] Thread deleted for @{handle}, skipping")
+                    self._fetched_threads.pop(thread_id, None)
+                    logger.warning("[BSKY_MONITOR] Thread deleted for @%s, skipping", handle)
                 else:
-                    print(f"[BSKY_MONITOR] Discord error for @{handle}: {e}")
+                    logger.warning("[BSKY_MONITOR] Discord error for @%s: %s", handle, e)
                 
                 # Always mark as seen to prevent infinite loops
                 if uri:
                     self.state.set_last_seen_uri(handle, uri)
                     
-            except Exception as e:
+            except Exception:
                 # Any other error
-                print(f"[BSKY_MONITOR] Error posting for @{handle}: {e}")
+                logger.exception("[BSKY_MONITOR] Error posting for @%s", handle)
                 
                 # Always mark as seen to prevent infinite loops
                 post = item.get("post", {})
@@ -138,60 +228,59 @@ class BlueskyMonitor(commands.Cog):
         """
         handle = sub.handle
 
-        # Fetch feed (newest -> oldest)
-        try:
-            feed_response = await self.api.get_author_feed(handle, limit=100)  # Increased to handle reply-heavy accounts
-        except Exception as e:
-            print(f"[BSKY_MONITOR] API error for @{handle}: {e}")
-            return
+        # Conditional fetch: getAuthorFeed has no since/ETag support, so probe
+        # the single newest entry and skip the full fetch if it hasn't moved.
+        # A head is only stored after a check that found nothing new, so
+        # handles that are actively posting go straight to the full fetch.
+        known_head = self.state.get_feed_head(handle)
+        if known_head and self.state.get_last_seen_uri(handle):
+            try:
+                probe = parse_feed(await self.api.get_author_feed(handle, limit=1))
+            except Exception:
+                probe = None  # fall through to the full fetch
+            if probe and probe[0] and _feed_head(probe[0][0]) == known_head:
+                return
 
-        # Validate response
-        if not feed_response:
-            print(f"[BSKY_MONITOR] Empty response for @{handle}")
-            return
-        
-        # Handle both dict and list responses
-        if isinstance(feed_response, dict):
-            feed_items = feed_response.get("feed", [])
-        elif isinstance(feed_response, list):
-            feed_items = feed_response
-        else:
-            print(f"[BSKY_MONITOR] Invalid feed format for @{handle}: {type(feed_response)}")
-            return
-        
-        if not feed_items:
-            return
+        # Get last seen URI
+        last_seen = self.state.get_last_seen_uri(handle)
 
-        # Filter to non-reply items only
-        non_reply_items: List[dict] = []
-        for item in feed_items:
-            if not isinstance(item, dict):
-                continue
-            
-            post = item.get("post") or {}
-            record = post.get("record") or {}
-            
-            # Skip replies - check if "reply" key exists in record at all
-            # (presence of the key means it's a reply, regardless of value)
-            if "reply" in record:
-                continue
-                
-            non_reply_items.append(item)
+        # Fetch feed (newest -> oldest); a short page unless this handle
+        # keeps needing the wide one
+        wide = self._widen_counts.get(handle, 0) >= WIDEN_STICKY_AFTER
+        fetched = await self._fetch_non_replies(handle, FEED_LIMIT_WIDE if wide else FEED_LIMIT)
+        if fetched is None:
+            return
+        non_reply_items, uris, uri_index, feed_pos, head = fetched
+
+        # Watermark (or any non-reply) missing from the short page: widen
+        # before deciding to resync. Not needed for the initial sync.
+        if last_seen and not wide and uri_index.get(last_seen) is None:
+            self._widen_counts[handle] = self._widen_counts.get(handle, 0) + 1
+            fetched = await self._fetch_non_replies(handle, FEED_LIMIT_WIDE)
+            if fetched is None:
+                return
+            non_reply_items, uris, uri_index, feed_pos, head = fetched
+
+        # Watermark within the short page's range: this handle doesn't need
+        # the wide page, so the miss streak (and any stickiness) ends
+        seen_at = uri_index.get(last_seen) if last_seen else None
+        if seen_at is not None and feed_pos[seen_at] < FEED_LIMIT:
+            self._widen_counts.pop(handle, None)
 
         if not non_reply_items:
             return
 
-        # Get last seen URI
-        last_seen = self.state.get_last_seen_uri(handle)
+        # From here every path settles the watermark; only a check that found
+        # nothing new keeps a head for the next probe (cleared otherwise)
+        self.state.set_feed_head(handle, None)
 
         # Case 1: No last seen - initial sync
         if not last_seen:
-            print(f"[BSKY_MONITOR] Initial sync for @{handle}: posting 5 newest")
+            logger.info("[BSKY_MONITOR] Initial sync for @%s: posting 5 newest", handle)
             catch_up_items = non_reply_items[:5]
             
             # Mark newest as seen
-            newest = non_reply_items[0]
-            newest_uri = newest.get("post", {}).get("uri")
+            newest_uri = uris[0]
             if newest_uri:
                 self.state.set_last_seen_uri(handle, newest_uri)
             
@@ -199,21 +288,15 @@ class BlueskyMonitor(commands.Cog):
             return
 
         # Case 2: Find last_seen in current feed
-        last_seen_index = None
-        for i, item in enumerate(non_reply_items):
-            uri = item.get("post", {}).get("uri")
-            if uri == last_seen:
-                last_seen_index = i
-                break
+        last_seen_index = seen_at
 
         # Case 3: last_seen not in feed - resync
         if last_seen_index is None:
-            print(f"[BSKY_MONITOR] Resync for @{handle}: last_seen not in feed")
+            logger.info("[BSKY_MONITOR] Resync for @%s: last_seen not in feed", handle)
             catch_up_items = non_reply_items[:5]
             
             # Mark newest as seen
-            newest = non_reply_items[0]
-            newest_uri = newest.get("post", {}).get("uri")
+            newest_uri = uris[0]
             if newest_uri:
                 self.state.set_last_seen_uri(handle, newest_uri)
             
@@ -224,13 +307,14 @@ class BlueskyMonitor(commands.Cog):
         new_items = non_reply_items[:last_seen_index]
         
         if not new_items:
-            return  # No new posts
+            # No new posts: the watermark already covers this head
+            self.state.set_feed_head(handle, head)
+            return
 
-        print(f"[BSKY_MONITOR] Found {len(new_items)} new posts for @{handle}")
+        logger.info("[BSKY_MONITOR] Found %d new posts for @%s", len(new_items), handle)
 
         # Mark newest as seen BEFORE posting (prevent double-post on error)
-        newest = new_items[0]
-        newest_uri = newest.get("post", {}).get("uri")
+        newest_uri = uris[0]
         if newest_uri:
             self.state.set_last_seen_uri(handle, newest_uri)
 
@@ -238,14 +322,62 @@ class BlueskyMonitor(commands.Cog):
         new_items.reverse()
         await self._send_items_to_thread(handle, new_items)
 
+    async def _fetch_non_replies(
+        self,
+        handle: str,
+        limit: int,
+    ) -> Optional[Tuple[List[dict], List[Optional[str]], Dict[str, int], List[int], str]]:
+        """
+        Fetch one feed page and return its non-reply items, their URIs,
+        a URI -> position index, each item's position in the raw page and
+        the page's _feed_head(). None if the fetch failed or was empty.
+        """
+        try:
+            feed_response = await self.api.get_author_feed(handle, limit=limit)
+        except Exception as e:
+            logger.warning("[BSKY_MONITOR] API error for @%s: %s", handle, e)
+            return None
+
+        # Validate response
+        if not feed_response:
+            logger.warning("[BSKY_MONITOR] Empty response for @%s", handle)
+            return None
+        
+        # Handle both dict and list responses; one walk over the raw feed
+        parsed = parse_feed(feed_response)
+        if parsed is None:
+            logger.warning("[BSKY_MONITOR] Invalid feed format for @%s: %s", handle, type(feed_response))
+            return None
+        
+        feed_items, feed_uris, is_reply = parsed
+        if not feed_items:
+            return None
+
+        # Filter to non-reply items only, keeping each one's URI and a
+        # URI -> position index
+        non_reply_items: List[dict] = []
+        uris: List[Optional[str]] = []
+        uri_index: Dict[str, int] = {}
+        feed_pos: List[int] = []
+        for pos, (item, uri, reply) in enumerate(zip(feed_items, feed_uris, is_reply)):
+            if reply:
+                continue
+            if uri and uri not in uri_index:
+                uri_index[uri] = len(non_reply_items)
+            non_reply_items.append(item)
+            uris.append(uri)
+            feed_pos.append(pos)
+
+        return non_reply_items, uris, uri_index, feed_pos, _feed_head(feed_items[0])
+
     # ------------------------------------------------------------
     # BLUESKY CACHE CLEANUP LOOP
     # ------------------------------------------------------------
     @tasks.loop(hours=24)
     async def _cache_cleanup_loop(self):
-        deleted = cleanup_bluesky_cache()
+        deleted = await cleanup_bluesky_cache_async()
         if deleted:
-            print(f"[BSKY_MONITOR] Cleaned {deleted} cached Bluesky media files.")
+            logger.info("[BSKY_MONITOR] Cleaned %d cached Bluesky media files.", deleted)
 
     @_cache_cleanup_loop.before_loop
     async def before_cache_cleanup(self):
@@ -254,9 +386,10 @@ class BlueskyMonitor(commands.Cog):
     # ------------------------------------------------------------
     # SHUTDOWN CLEANUP
     # ------------------------------------------------------------
-    def cog_unload(self):
+    async def cog_unload(self):
         self._monitor_loop.cancel()
         self._cache_cleanup_loop.cancel()
+        await self.state.flush()
 
 
 async def setup(bot: commands.Bot):
@@ -9,16 +9,20 @@ This cog is USER-INITIATED ONLY and never posts to channels.
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import re
+import time
 from pathlib import Path
-from typing import Optional, List
+from typing import Dict, Optional, List, Tuple
 
 import discord
 from discord.ext import commands
 
 from config import DISCORD_OWNER_ID, MEDIA_ROOT, MEDIAWATCHER_DATA, DROPBOX_WATCH_ROOT
 from utils.bluesky.api import BlueskyAPI
+from utils.bluesky.embed_builder import build_bsky_url
+from utils.bluesky.feed import parse_feed
 from utils.bluesky.media import download_media_for_feed_item
 from utils.mediawatcher.mediawatcher import create_mediawatcher
 
@@ -33,6 +37,36 @@ logger = logging.getLogger(__name__)
 PEACH_EMOJI = "🍑"   # Full UI prompt
 FLOPPY_EMOJI = "💾"  # Quick save (SFW)
 NSFW_EMOJI = "🔞"    # Quick save (NSFW)
+_TRIGGER_EMOJIS = frozenset({PEACH_EMOJI, FLOPPY_EMOJI, NSFW_EMOJI})
+
+# Markdown link target in the embed's "View Post" field
+_POST_URL_RE = re.compile(r"\((https?://[^)]+)\)")
+
+# Reaction bursts on one handle reuse its fetched feed for this long
+FEED_CACHE_TTL = 15.0
+
+# MediaWatcher isn't known to be thread-safe: ingests run off the event
+# loop, but one batch at a time
+_INGEST_LOCK = asyncio.Lock()
+
+
+async def _ingest_files(mediawatcher, files: List[Path], **kwargs) -> list:
+    """Run ingest_from_bluesky for each file on a worker thread, in order."""
+    def _run():
+        return [
+            mediawatcher.ingest_from_bluesky(file_path=f, **kwargs)
+            for f in files
+        ]
+
+    async with _INGEST_LOCK:
+        return await asyncio.to_thread(_run)
+
+
+# Discord's cap on options in one select menu
+MAX_SELECT_OPTIONS = 25
+# Slug dropdown options are rebuilt at most this often (people added
+# through other cogs show up without a reload)
+SLUG_OPTIONS_TTL = 60.0
 
 
 class BlueskyReactCog(commands.Cog):
@@ -60,8 +94,32 @@ class BlueskyReactCog(commands.Cog):
             dropbox_dir=DROPBOX_WATCH_ROOT,
         )
 
+        # Prebuilt SlugSelector options, shared by every 🍑 prompt
+        self._slug_options: List[discord.SelectOption] = []
+        self._slug_total = 0
+        self._slug_options_at = float("-inf")
+        self.refresh_slug_options()
+
+        # handle -> (fetched_at, post URL -> feed item)
+        self._feed_cache: Dict[str, Tuple[float, Dict[str, dict]]] = {}
+
         logger.info("[BlueskyReact] Initialized with MediaWatcher")
 
+    def refresh_slug_options(self) -> None:
+        """Rebuild the slug dropdown options from MediaWatcher."""
+        slugs = sorted(self.mediawatcher.get_all_slugs())
+        self._slug_total = len(slugs)
+        self._slug_options = [
+            discord.SelectOption(label=slug, value=slug, description=f"Save as {slug}")
+            for slug in slugs[:MAX_SELECT_OPTIONS]
+        ]
+        self._slug_options_at = time.monotonic()
+
+    def slug_options(self) -> List[discord.SelectOption]:
+        if time.monotonic() - self._slug_options_at >= SLUG_OPTIONS_TTL:
+            self.refresh_slug_options()
+        return self._slug_options
+
     # ──────────────────────────────────────────────────────────
     # REACTION LISTENER
     # ──────────────────────────────────────────────────────────
@@ -72,7 +130,12 @@ class BlueskyReactCog(commands.Cog):
             return
 
         emoji = str(payload.emoji)
-        if emoji not in {PEACH_EMOJI, FLOPPY_EMOJI, NSFW_EMOJI}:
+        if emoji not in _TRIGGER_EMOJIS:
+            return
+
+        # Guild channels only, and never our own reactions - all before any
+        # cache lookup or HTTP request
+        if payload.guild_id is None or payload.user_id == self.bot.user.id:
             return
 
         channel = self.bot.get_channel(payload.channel_id)
@@ -80,7 +143,7 @@ class BlueskyReactCog(commands.Cog):
             return
 
         try:
-            message = await channel.fetch_message(payload.message_id)
+            message = await channel.get_partial_message(payload.message_id).fetch()
         except discord.NotFound:
             return
 
@@ -118,12 +181,15 @@ class BlueskyReactCog(commands.Cog):
     # ──────────────────────────────────────────────────────────
     @staticmethod
     def _extract_post_url(embed: discord.Embed) -> Optional[str]:
-        for field in embed.fields:
-            if "View Post" in field.name and field.value:
-                match = re.search(r"\((https?://[^)]+)\)", field.value)
-                if match:
-                    return match.group(1)
-        return None
+        return next(
+            (
+                match.group(1)
+                for field in embed.fields
+                if "View Post" in field.name and field.value
+                and (match := _POST_URL_RE.search(field.value))
+            ),
+            None,
+        )
 
     @staticmethod
     def _extract_handle_from_url(url: str) -> Optional[str]:
@@ -134,23 +200,30 @@ class BlueskyReactCog(commands.Cog):
         return None
 
     async def _fetch_feed_item(self, handle: str, post_url: str) -> Optional[dict]:
+        # A recent fetch of this handle answers adjacent reactions; a miss
+        # may be a post newer than the cache, so it falls through to a fetch
+        cached = self._feed_cache.get(handle)
+        if cached and time.monotonic() - cached[0] < FEED_CACHE_TTL:
+            item = cached[1].get(post_url)
+            if item is not None:
+                return item
+
         feed_response = await self.api.get_author_feed(handle, limit=50)
         
         # Handle both dict and list responses
-        if isinstance(feed_response, dict):
-            feed_items = feed_response.get("feed", [])
-        elif isinstance(feed_response, list):
-            feed_items = feed_response
-        else:
+        parsed = parse_feed(feed_response)
+        if parsed is None:
             return None
         
-        from utils.bluesky.embed_builder import build_bsky_url
-
-        for item in feed_items:
-            post = item.get("post") or {}
-            if build_bsky_url(post) == post_url:
-                return item
-        return None
+        # Index the page by URL once; setdefault keeps the first (newest) entry
+        by_url: Dict[str, dict] = {}
+        for item in parsed[0]:
+            url = build_bsky_url(item.get("post") or {})
+            if url:
+                by_url.setdefault(url, item)
+        self._feed_cache[handle] = (time.monotonic(), by_url)
+        
+        return by_url.get(post_url)
 
     # ──────────────────────────────────────────────────────────
     # 🍑 FULL UI FLOW
@@ -162,7 +235,7 @@ class BlueskyReactCog(commands.Cog):
                 await user.send("⚠️ Could not locate this post on Bluesky.")
                 return
 
-            images, videos, thumb, _, _ = await download_media_for_feed_item(
+            images, videos, thumb, _, _, _ = await download_media_for_feed_item(
                 self.api, feed_item
             )
 
@@ -185,6 +258,8 @@ class BlueskyReactCog(commands.Cog):
             thumb,
             original_message=message,
             original_user=user,
+            slug_options=self.slug_options(),
+            slug_total=self._slug_total,
         )
 
         embed = discord.Embed(
@@ -222,7 +297,7 @@ class BlueskyReactCog(commands.Cog):
                 await user.send("⚠️ Could not locate this post.")
                 return
 
-            images, videos, _, _, post_uri = await download_media_for_feed_item(
+            images, videos, _, _, post_uri, _ = await download_media_for_feed_item(
                 self.api, feed_item
             )
 
@@ -235,20 +310,17 @@ class BlueskyReactCog(commands.Cog):
             await user.send("⚠️ No media found.")
             return
 
-        results = []
         post_id = post_uri.split("/")[-1] if post_uri else "unknown"
 
-        for file in files:
-            results.append(
-                self.mediawatcher.ingest_from_bluesky(
-                    file_path=file,
-                    handle=normalized,
-                    post_url=post_url,
-                    post_id=post_id,
-                    slug=slug,
-                    nsfw=nsfw,
-                )
-            )
+        results = await _ingest_files(
+            self.mediawatcher,
+            files,
+            handle=normalized,
+            post_url=post_url,
+            post_id=post_id,
+            slug=slug,
+            nsfw=nsfw,
+        )
 
         success = sum(1 for r in results if r.success)
         errors = len(results) - success
@@ -285,7 +357,8 @@ class BlueskyDownloadView(discord.ui.View):
 
     def __init__(self, mediawatcher, handle, post_url, feed_item,
                  image_paths, video_paths, thumb_path,
-                 original_message=None, original_user=None):
+                 original_message=None, original_user=None,
+                 slug_options=None, slug_total=0):
         super().__init__(timeout=300)
         self.mediawatcher = mediawatcher
         self.handle = handle
@@ -301,7 +374,7 @@ class BlueskyDownloadView(discord.ui.View):
         self.nsfw: bool = False
         
         # Add slug selector
-        self.add_item(SlugSelector(mediawatcher))
+        self.add_item(SlugSelector(slug_options or [], slug_total))
 
     @discord.ui.button(label="NSFW", style=discord.ButtonStyle.secondary, emoji="🔞")
     async def toggle_nsfw(self, interaction: discord.Interaction, button: discord.ui.Button):
@@ -336,17 +409,15 @@ class BlueskyDownloadView(discord.ui.View):
         post_uri = post.get("uri", "")
         post_id = post_uri.split("/")[-1] if post_uri else "unknown"
         
-        results = []
-        for file_path in files:
-            result = self.mediawatcher.ingest_from_bluesky(
-                file_path=file_path,
-                handle=self.handle,
-                post_url=self.post_url,
-                post_id=post_id,
-                slug=self.selected_slug,
-                nsfw=self.nsfw,
-            )
-            results.append(result)
+        results = await _ingest_files(
+            self.mediawatcher,
+            files,
+            handle=self.handle,
+            post_url=self.post_url,
+            post_id=post_id,
+            slug=self.selected_slug,
+            nsfw=self.nsfw,
+        )
         
         # Build result embed
         success_count = sum(1 for r in results if r.success)
@@ -397,20 +468,10 @@ class BlueskyDownloadView(discord.ui.View):
 class SlugSelector(discord.ui.Select):
     """Dropdown for selecting which slug to save media under"""
     
-    def __init__(self, mediawatcher):
-        # Get all available slugs
-        all_slugs = mediawatcher.get_all_slugs()
-        
-        # Create options (Discord limit: 25 max)
-        options = []
-        for slug in all_slugs[:25]:
-            options.append(
-                discord.SelectOption(
-                    label=slug,
-                    value=slug,
-                    description=f"Save as {slug}"
-                )
-            )
+    def __init__(self, options: List[discord.SelectOption], total: int = 0):
+        # Options are prebuilt by the cog (Discord limit: 25 max); copy the
+        # list so this menu never shares it with other views
+        options = list(options)
         
         if not options:
             options.append(
@@ -421,8 +482,14 @@ class SlugSelector(discord.ui.Select):
                 )
             )
         
+        # Say so when the menu can't hold every slug
+        if total > len(options):
+            placeholder = f"Select a slug (first {len(options)} of {total})..."
+        else:
+            placeholder = "Select a slug..."
+        
         super().__init__(
-            placeholder="Select a slug...",
+            placeholder=placeholder,
             min_values=1,
             max_values=1,
             options=options
@@ -1,5 +1,8 @@
 import abc
-from typing import Any, Dict, Optional
+import contextlib
+from typing import Any, AsyncIterator, Dict, Optional
+
+import aiohttp
 
 
 class BaseScraper(abc.ABC):
@@ -10,6 +13,19 @@ class BaseScraper(abc.ABC):
 
     site_name: str = "base"
 
+    def __init__(self, session: Optional[aiohttp.ClientSession] = None):
+        # Shared keep-alive session injected by the pipeline; None means
+        # each fetch opens (and closes) its own.
+        self.session = session
+
+    @contextlib.asynccontextmanager
+    async def _session(self) -> AsyncIterator[aiohttp.ClientSession]:
+        if self.session is not None:
+            yield self.session
+            return
+        async with aiohttp.ClientSession() as session:
+            yield session
+
     @abc.abstractmethod
     async def fetch(self, performer_name: str) -> Optional[Dict[str, Any]]:
         """
@@ -22,10 +22,6 @@ import statistics
 import sys
 import io
 
-# Force UTF-8 encoding for stdout/stderr on Windows
-sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
-sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
-
 PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 import arena_config
@@ -388,7 +384,7 @@ class ExternalDataProcessor:
         return candidates
 
 
-if __name__ == "__main__":
+def main() -> None:
     processor = ExternalDataProcessor()
     signals = processor.process_all()
     
@@ -399,3 +395,10 @@ if __name__ == "__main__":
         print("=" * 80)
         for name, s in top:
             print(f"{name:30} Score: {s.discovery_score:5.1f} | C:{s.competitive_score:4.0f} M:{s.momentum_score:4.0f} R:{s.resume_score:4.0f} A:{s.appeal_score:4.0f}")
+
+
+if __name__ == "__main__":
+    # Force UTF-8 encoding for stdout/stderr on Windows
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+    sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
+    main()
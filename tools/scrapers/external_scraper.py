@@ -29,10 +29,6 @@ import re
 import sys
 import io
 
-# Force UTF-8 encoding for stdout/stderr on Windows
-sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
-sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
-
 # Add parent to path for imports
 # Use .resolve() to get absolute path (handles relative __file__ from subprocess)
 PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
@@ -180,6 +176,13 @@ class ExternalRankingsScraper:
         return results
 
 
-if __name__ == "__main__":
+def main() -> None:
     scraper = ExternalRankingsScraper()
     scraper.scrape_all()
+
+
+if __name__ == "__main__":
+    # Force UTF-8 encoding for stdout/stderr on Windows
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+    sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
+    main()
@@ -9,10 +9,6 @@ import sys
 import io
 from pathlib import Path
 
-# Force UTF-8 encoding for stdout/stderr on Windows
-sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
-sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
-
 sys.path.append(str(Path(__file__).resolve().parents[3]))
 
 import json
@@ -97,6 +93,13 @@ class ArenaAutoAdder:
         ]
 
 
-if __name__ == "__main__":
+def main() -> None:
     added = ArenaAutoAdder().run()
     print(f"Added {added} rows to ARENA_INTAKE")
+
+
+if __name__ == "__main__":
+    # Force UTF-8 encoding for stdout/stderr on Windows
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+    sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
+    main()
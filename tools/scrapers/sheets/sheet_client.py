@@ -7,7 +7,7 @@ Provides methods for reading and writing to Google Sheets.
 from google.oauth2.service_account import Credentials
 from googleapiclient.discovery import build
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
 import sys
 
 # Add project root to path
@@ -100,3 +100,22 @@ class SheetClient:
             valueInputOption="RAW",
             body={"values": [values]},
         ).execute()
+    
+    def batch_update_rows(
+        self,
+        spreadsheet_id: str,
+        sheet_name: str,
+        updates: List[Tuple[int, List]],
+    ):
+        """Update several rows in a single values.batchUpdate request."""
+        if not updates:
+            return
+        
+        data = [
+            {"range": f"{sheet_name}!A{row_number}", "values": [values]}
+            for row_number, values in updates
+        ]
+        self.service.spreadsheets().values().batchUpdate(
+            spreadsheetId=spreadsheet_id,
+            body={"valueInputOption": "RAW", "data": data},
+        ).execute()
@@ -1,12 +1,13 @@
 from typing import Optional, Dict, Any
 from tools.scrapers.base_scraper import BaseScraper
+from utils.arena.rate_limiter import rate_limited, raise_for_retry
 import arena_config
-import aiohttp
 
 
 class TMDBScraper(BaseScraper):
     site_name = "tmdb"
 
+    @rate_limited("api.themoviedb.org")
     async def fetch(self, performer_name: str) -> Optional[Dict[str, Any]]:
         api_key = arena_config.TMDB_API_KEY
         if not api_key:
@@ -17,8 +18,9 @@ class TMDBScraper(BaseScraper):
             f"?api_key={api_key}&query={performer_name}"
         )
 
-        async with aiohttp.ClientSession() as session:
+        async with self._session() as session:
             async with session.get(url, timeout=30) as r:
+                raise_for_retry(r)
                 if r.status != 200:
                     return None
 